@@ -94,14 +94,24 @@ def _preflight_real(safe_code: Optional[str] = None) -> None:
                 "SAFE is ON — provide valid unlock code to place REAL orders"
             )
     try:
-        # Best-effort clock sync; errors are non-fatal (Binance will still validate recvWindow)
-        tsync.sync_time()
+        # Best-effort clock sync; errors are non-fatal (Binance will still validate recvWindow).
+        # Blocks only when the offset is stale; the background worker keeps it fresh.
+        tsync.ensure_synced()
     except Exception:
         _log_throttled(
             "orders_real.time_sync",
             "orders_real: time sync failed (best-effort, continuing)",
             interval_s=300.0,
         )
+    try:
+        # started even if the sync above failed: the worker retries on its own cadence
+        tsync.start_time_sync_worker()
+    except Exception:
+        _log_throttled(
+            "orders_real.time_sync_worker",
+            "orders_real: time sync worker failed to start (continuing)",
+            interval_s=300.0,
+        )
 
 
 
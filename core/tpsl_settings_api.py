@@ -9,18 +9,53 @@ make any decisions on their own.
 """
 
 import logging
-from typing import Any, Dict
+from typing import Any, Callable, Dict
 
 log = logging.getLogger(__name__)
 
 
+# ---------------------------------------------------------------------
+# Lazy import cache
+# ---------------------------------------------------------------------
+
+# Callables resolved by the lazy imports below; imports stay deferred
+# (no import-time coupling) but are paid only once per process.
+_resolved: Dict[str, Callable[..., Any]] = {}
+
+
+def _get(name: str, imp: Callable[[], Callable[..., Any]]) -> Callable[..., Any]:
+    fn = _resolved.get(name)
+    if fn is None:
+        fn = _resolved.setdefault(name, imp())
+    return fn
+
+
+def _imp_load_tpsl_settings():
+    from runtime.tpsl_settings_store import load_tpsl_settings
+    return load_tpsl_settings
+
+
+def _imp_ensure_safe_boot():
+    from core.runtime_state import ensure_safe_boot_contract_persisted
+    return ensure_safe_boot_contract_persisted
+
+
+def _imp_is_safe_on():
+    from tools.safe_lock import is_safe_on
+    return is_safe_on
+
+
+def _imp_is_panic_active():
+    from runtime.panic_tools import is_panic_active
+    return is_panic_active
+
+
 # ---------------------------------------------------------------------
 # Settings access
 # ---------------------------------------------------------------------
 
 def get_tpsl_settings() -> Dict[str, Any]:
-    from runtime.tpsl_settings_store import load_tpsl_settings
-    return load_tpsl_settings()
+    return _get("load_tpsl_settings", _imp_load_tpsl_settings)()
 
 def update_tpsl_settings(settings: Dict[str, Any]) -> None:
     from runtime.tpsl_settings_store import save_tpsl_settings
@@ -46,16 +81,14 @@ def request_tpsl_autostart(get_price_callable):
 
     # 1) Ensure safe boot contract (best-effort)
     try:
-        from core.runtime_state import ensure_safe_boot_contract_persisted
-        ensure_safe_boot_contract_persisted()
+        _get("ensure_safe_boot", _imp_ensure_safe_boot)()
     except Exception:
         log.exception("TPSL autostart: failed to ensure safe boot contract")
         return None
 
     # 2) SAFE policy
     try:
-        from tools.safe_lock import is_safe_on
-        if is_safe_on():
+        if _get("is_safe_on", _imp_is_safe_on)():
             log.warning("TPSL autostart blocked: SAFE is ON")
             return None
     except Exception:
@@ -64,8 +97,7 @@ def request_tpsl_autostart(get_price_callable):
 
     # 3) PANIC policy
     try:
-        from runtime.panic_tools import is_panic_active
-        if is_panic_active():
+        if _get("is_panic_active", _imp_is_panic_active)():
             log.warning("TPSL autostart blocked: PANIC is active")
             return None
     except Exception:
@@ -9,7 +9,21 @@
 from __future__ import annotations
 
 import time
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, NamedTuple, Optional
+
+
+class OpenPos(NamedTuple):
+    """Открытая позиция в TradeBook (фиксированный набор полей)."""
+
+    symbol: str
+    side: str
+    qty: float
+    entry: float
+    ts_open: int
+    tier: int
+    # tp/sl пока не считаем — резерв на будущее
+    tp: Optional[float] = None
+    sl: Optional[float] = None
 
 
 class TradeBook:
@@ -33,7 +47,7 @@ class TradeBook:
 
     def __init__(self) -> None:
         # открытые позиции по символам
-        self._open: Dict[str, Dict[str, Any]] = {}
+        self._open: Dict[str, OpenPos] = {}
         # закрытые сделки (история)
         self._closed: List[Dict[str, Any]] = []
 
@@ -83,23 +97,20 @@ class TradeBook:
         prev = self._open.get(sym)
         if prev is not None:
             try:
-                tier = int(prev.get("tier", 1)) + 1
+                tier = int(prev.tier) + 1
             except Exception:
                 tier = 2
         else:
             tier = 1
 
-        self._open[sym] = {
-            "symbol": sym,
-            "side": side_u,
-            "qty": qty_f,
-            "entry": price_f,
-            "ts_open": ts,
-            "tier": tier,
-            # tp/sl пока не считаем — резерв на будущее
-            "tp": None,
-            "sl": None,
-        }
+        self._open[sym] = OpenPos(
+            symbol=sym,
+            side=side_u,
+            qty=qty_f,
+            entry=price_f,
+            ts_open=ts,
+            tier=tier,
+        )
 
     def close(self, symbol: str, price: float, reason: str = "CLOSE") -> None:
         """Зафиксировать закрытие позиции + добавить строку в историю.
@@ -123,10 +134,10 @@ class TradeBook:
         pnl_pct: Optional[float] = None
 
         if pos is not None:
-            entry = pos.get("entry")
-            qty = pos.get("qty")
-            side = str(pos.get("side", "BUY")).upper()
-            tier = pos.get("tier", "-")
+            entry = pos.entry
+            qty = pos.qty
+            side = pos.side
+            tier = pos.tier
 
             try:
                 entry_f = float(entry) if entry is not None else None
@@ -154,8 +165,8 @@ class TradeBook:
             "symbol": sym,
             "tier": tier,
             "action": (reason or "CLOSE").upper(),
-            "tp": pos.get("tp") if pos else None,
-            "sl": pos.get("sl") if pos else None,
+            "tp": pos.tp if pos else None,
+            "sl": pos.sl if pos else None,
             "pnl_pct": pnl_pct,
             "pnl_abs": pnl_cash,
             "qty": qty,
@@ -179,21 +190,22 @@ class TradeBook:
 
         # открытые позиции как псевдо-сделки (чтобы были видны в журнале)
         for sym, pos in self._open.items():
-            ts_open = pos.get("ts_open") or self._now_ts()
-            time_str = self._fmt_time(int(ts_open))
+            # ts_open всегда проставляется в open(); _fmt_time сам подставит
+            # текущее время для пустого значения
+            time_str = self._fmt_time(pos.ts_open)
 
             rows.append(
                 {
                     "time": time_str,
                     "symbol": sym,
-                    "tier": pos.get("tier", "-"),
+                    "tier": pos.tier,
                     "action": "OPEN",
-                    "tp": pos.get("tp"),
-                    "sl": pos.get("sl"),
+                    "tp": pos.tp,
+                    "sl": pos.sl,
                     "pnl_pct": None,
                     "pnl_abs": None,
-                    "qty": pos.get("qty"),
-                    "entry": pos.get("entry"),
+                    "qty": pos.qty,
+                    "entry": pos.entry,
                     "exit": None,
                 }
             )
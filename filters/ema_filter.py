@@ -18,10 +18,11 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Any
 
-import math
-
 from .base_filter import BaseFilter, FilterContext
 
+_INF = float("inf")
+_NINF = float("-inf")
+
 
 @dataclass
 class EMAFilter(BaseFilter):
@@ -90,7 +91,12 @@ class EMAFilter(BaseFilter):
             # нет валидных EMA — не режем
             return True
 
-        if any(math.isnan(v) or math.isinf(v) for v in (ema_s, ema_l)):
+        # NaN != NaN; inline сравнения дешевле any()+math.isnan/isinf
+        if (
+            ema_s != ema_s or ema_l != ema_l
+            or ema_s == _INF or ema_s == _NINF
+            or ema_l == _INF or ema_l == _NINF
+        ):
             return True
 
         price_f = None
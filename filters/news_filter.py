@@ -20,10 +20,11 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Any
 
-import math
-
 from .base_filter import BaseFilter, FilterContext
 
+_INF = float("inf")
+_NINF = float("-inf")
+
 
 @dataclass
 class NewsFilter(BaseFilter):
@@ -82,7 +83,12 @@ class NewsFilter(BaseFilter):
             # Некорректные значения — просто пропускаем
             return True
 
-        if any(math.isnan(v) or math.isinf(v) for v in (sentiment, score)):
+        # NaN != NaN; inline сравнения дешевле any()+math.isnan/isinf
+        if (
+            sentiment != sentiment or score != score
+            or sentiment == _INF or sentiment == _NINF
+            or score == _INF or score == _NINF
+        ):
             return True
 
         # Проверка минимальной уверенности
@@ -6,8 +6,24 @@ import tempfile
 import time
 from typing import Any, Dict, Optional
 
+try:
+    import orjson  # optional: fast C encoder, emits bytes directly
+except ImportError:
+    orjson = None
+
 SIM_STATE_PATH = os.path.join("runtime", "sim_state.json")
 
+# Не пишем одинаковый снапшот чаще, чем раз в SAVE_MIN_INTERVAL_SEC.
+SAVE_MIN_INTERVAL_SEC = 0.5
+
+# Конец indent=2 вывода, когда "meta" — последний ключ снапшота: перед ним
+# дописываем saved_at в уже сериализованные байты, без второго _dumps.
+_META_TAIL = b"\n  }\n}"
+
+_last_hash: Optional[int] = None
+_last_saved: float = 0.0
+_dir_ready: bool = False
+
 
 def load_sim_state() -> Optional[Dict[str, Any]]:
     """Безопасное чтение runtime/sim_state.json.
@@ -42,34 +58,74 @@ def load_sim_state() -> Optional[Dict[str, Any]]:
     return data
 
 
+def _dumps(data: Dict[str, Any]) -> bytes:
+    """Сериализация снапшота в UTF-8 байты (orjson, если доступен)."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            # orjson строже stdlib (например, int > 64 бит) — откатываемся на json
+            pass
+    return json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+
+
 def save_sim_state(snapshot: Dict[str, Any]) -> None:
     """Атомарная запись runtime/sim_state.json.
 
     Никаких исключений наружу не выбрасывает — в SIM-режиме потеря снапшота не
     должна ломать UI.
+
+    Если содержимое не изменилось с прошлой записи и не прошло
+    SAVE_MIN_INTERVAL_SEC — запись пропускается (dirty-flag).
     """
+    global _last_hash, _last_saved, _dir_ready
+
     if not isinstance(snapshot, dict):
         return
 
     data: Dict[str, Any] = dict(snapshot)
-    meta = data.setdefault("meta", {})
+    meta = data.pop("meta", None)
+    meta = dict(meta) if isinstance(meta, dict) else {}
+    data["meta"] = meta  # последним ключом — см. _META_TAIL
     meta.setdefault("version", "sim_state_v1")
-    meta["saved_at"] = time.time()
+    meta.pop("saved_at", None)
+
+    # одна сериализация: dirty-check по содержимому без saved_at,
+    # сам saved_at (последний ключ meta) вклеивается в эти же байты
+    body = _dumps(data)
+    digest = hash(body)
+    now = time.monotonic()
+    if digest == _last_hash and now - _last_saved < SAVE_MIN_INTERVAL_SEC:
+        return
+
+    saved_at = time.time()
+    meta["saved_at"] = saved_at
+    if body.endswith(_META_TAIL):
+        cut = len(body) - len(_META_TAIL)
+        body = b"".join((body[:cut], b',\n    "saved_at": ', repr(saved_at).encode("ascii"), _META_TAIL))
+    else:
+        body = _dumps(data)
 
     directory = os.path.dirname(SIM_STATE_PATH) or "."
-    os.makedirs(directory, exist_ok=True)
+    if not _dir_ready:
+        # каталог создаём один раз за процесс, а не stat'ом на каждую запись
+        os.makedirs(directory, exist_ok=True)
+        _dir_ready = True
 
     fd, tmp_path = tempfile.mkstemp(prefix="sim_state_", suffix=".json", dir=directory)
     try:
-        with os.fdopen(fd, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        with os.fdopen(fd, "wb") as f:
+            f.write(body)
         os.replace(tmp_path, SIM_STATE_PATH)
-    finally:
+        _last_hash = digest
+        _last_saved = now
+    except BaseException:
+        # после успешного os.replace временного файла уже нет — чистим только при сбое
         try:
-            if os.path.exists(tmp_path):
-                os.remove(tmp_path)
+            os.remove(tmp_path)
         except Exception:
             pass
+        raise
 
 def clear_sim_state() -> None:
     """
@@ -78,6 +134,8 @@ def clear_sim_state() -> None:
     Используется, когда нужно принудительно забыть SIM-снимок,
     например по запросу от UI ('Reset SIM').
     """
+    global _last_hash
+    _last_hash = None
     try:
         if os.path.exists(SIM_STATE_PATH):
             os.remove(SIM_STATE_PATH)
@@ -9,16 +9,22 @@ runtime/tpsl_settings_store.py — единое хранилище TPSL-наст
 """
 
 from pathlib import Path
-from typing import Any, Dict
+from types import MappingProxyType
+from typing import Any, Dict, Mapping
 import json
 import logging
 
+try:
+    import orjson  # optional: faster parse/serialize, works on bytes directly
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 SETTINGS_PATH = Path("runtime/settings.json")
 
 
-def _default_settings() -> Dict[str, Any]:
+def _build_defaults() -> Dict[str, Any]:
     """
     Базовые TPSL-настройки по умолчанию.
 
@@ -34,6 +40,15 @@ def _default_settings() -> Dict[str, Any]:
     }
 
 
+# Defaults не меняются за время работы процесса — собираем шаблон один раз
+# (read-only), копию делаем только там, где нужен изменяемый dict.
+_DEFAULTS: Mapping[str, Any] = MappingProxyType(_build_defaults())
+
+
+def _default_settings() -> Dict[str, Any]:
+    return dict(_DEFAULTS)
+
+
 def load_tpsl_settings() -> Dict[str, Any]:
     """
     Безопасное чтение TPSL-настроек.
@@ -41,21 +56,30 @@ def load_tpsl_settings() -> Dict[str, Any]:
     Никогда не кидает исключения наружу:
     - при любой ошибке вернёт структуру по умолчанию.
     """
+    # без exists(): отсутствие файла — обычный случай, ловим только его
     try:
-        if SETTINGS_PATH.exists():
-            raw = SETTINGS_PATH.read_text(encoding="utf-8")
-            if raw.strip():
-                data = json.loads(raw)
-                if isinstance(data, dict):
-                    # дополняем недостающие поля default-значениями
-                    base = _default_settings()
-                    base.update(data)
-                    return base
-    except Exception:
+        raw = SETTINGS_PATH.read_bytes()
+    except FileNotFoundError:
+        return _default_settings()
+    except OSError:
         logger.exception("tpsl_settings_store: failed to read settings.json")
+        return _default_settings()
+
+    if not raw.strip():
+        return _default_settings()
+
+    try:
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+    except ValueError:
+        # orjson.JSONDecodeError / json.JSONDecodeError (и ошибки декодирования UTF-8)
+        logger.exception("tpsl_settings_store: failed to parse settings.json")
+        return _default_settings()
+
+    if not isinstance(data, dict):
+        return _default_settings()
 
-    # если файла нет или он битый — возвращаем defaults
-    return _default_settings()
+    # дополняем недостающие поля default-значениями
+    return {**_DEFAULTS, **data}
 
 
 def save_tpsl_settings(settings: Dict[str, Any]) -> None:
@@ -65,14 +89,17 @@ def save_tpsl_settings(settings: Dict[str, Any]) -> None:
     При ошибке — только лог, без исключений наружу.
     """
     try:
-        data = dict(_default_settings())
+        data = dict(_DEFAULTS)
         if isinstance(settings, dict):
             data.update(settings)
 
         SETTINGS_PATH.parent.mkdir(parents=True, exist_ok=True)
-        SETTINGS_PATH.write_text(
-            json.dumps(data, ensure_ascii=False, indent=2),
-            encoding="utf-8",
-        )
+        if orjson is not None:
+            payload = orjson.dumps(
+                data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            )
+        else:
+            payload = json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+        SETTINGS_PATH.write_bytes(payload)
     except Exception:
         logger.exception("tpsl_settings_store: failed to write settings.json")
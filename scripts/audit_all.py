@@ -20,18 +20,38 @@
 from __future__ import annotations
 
 import argparse
+import mmap
 import os
 import re
 import sys
 
 sys.dont_write_bytecode = True
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Tuple
+from typing import Dict, List, Tuple
+
+from scripts.clean_workspace import walk_repo
 
 
 ROOT = Path(__file__).resolve().parents[1]
 
+SCRIPT_TEXT_EXTS = {".sh", ".cmd", ".ps1", ".bat", ".txt"}
+RUNTIME_ARTIFACT_MIN_BYTES = 200_000
+
+CONTRACT_MODULES = [
+    "scripts.check_status_contract",
+    "scripts.check_ui_reason_string",
+    "scripts.check_explain_trace_contract",
+]
+# Stages run in order; modules inside one stage are independent and run concurrently.
+# check_ui_reason_string reads runtime/status.json emitted by check_status_contract,
+# check_explain_trace_contract works in its own temp dir.
+CONTRACT_STAGES = [
+    ["scripts.check_status_contract", "scripts.check_explain_trace_contract"],
+    ["scripts.check_ui_reason_string"],
+]
+
 
 DANGEROUS_PATTERNS: List[Tuple[str, re.Pattern]] = [
     ("rm -rf", re.compile(r"\brm\s+-rf\b", re.IGNORECASE)),
@@ -44,6 +64,16 @@ DANGEROUS_PATTERNS: List[Tuple[str, re.Pattern]] = [
     ("Invoke-RestMethod", re.compile(r"\bInvoke-RestMethod\b", re.IGNORECASE)),
 ]
 
+# All DANGEROUS_PATTERNS as one alternation: each file is scanned once instead of
+# once per pattern. Every alternative sits in a zero-width lookahead so that a long
+# match (e.g. "Remove-Item ... -Recurse") cannot hide another pattern inside it.
+DANGEROUS_COMBINED: re.Pattern = re.compile(
+    "|".join(f"(?=(?P<g{i}>{pat.pattern}))" for i, (_, pat) in enumerate(DANGEROUS_PATTERNS)),
+    re.IGNORECASE,
+)
+# Bytes flavour for scanning mmap'ed files without decoding (all patterns are ASCII).
+DANGEROUS_COMBINED_BYTES: re.Pattern = re.compile(DANGEROUS_COMBINED.pattern.encode("ascii"), re.IGNORECASE)
+
 
 def _hr(title: str) -> None:
     print("\n" + "=" * 78)
@@ -70,6 +100,18 @@ def _run_module(module: str, *, args: List[str] | None = None, env: dict[str, st
     return _run(cmd, cwd=ROOT, env=env)
 
 
+def _run_modules_concurrently(
+    modules: List[str], *, env: dict[str, str] | None = None
+) -> Dict[str, Tuple[int, str]]:
+    """Run independent modules in parallel subprocesses (overlaps interpreter startup)."""
+    if len(modules) < 2:
+        return {mod: _run_module(mod, env=env) for mod in modules}
+    workers = min(os.cpu_count() or 1, 6, len(modules))
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        futures = {mod: ex.submit(_run_module, mod, env=env) for mod in modules}
+        return {mod: fut.result() for mod, fut in futures.items()}
+
+
 def _read_text_safe(path: Path) -> str:
     try:
         return path.read_text(encoding="utf-8", errors="replace")
@@ -80,6 +122,30 @@ def _read_text_safe(path: Path) -> str:
             return ""
 
 
+def _scan_dangerous(path: Path) -> set[int]:
+    """Indexes into DANGEROUS_PATTERNS found in `path` (mmap'ed, no text decode/copy)."""
+    found: set[int] = set()
+    total = len(DANGEROUS_PATTERNS)
+
+    def _scan(buf) -> None:
+        for m in DANGEROUS_COMBINED_BYTES.finditer(buf):
+            found.add(int(m.lastgroup[1:]))
+            if len(found) == total:
+                break
+
+    try:
+        with open(path, "rb") as fh:
+            try:
+                with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    _scan(mm)
+            except (ValueError, OSError):
+                # empty file (cannot be mapped) or mmap unavailable -> plain read
+                _scan(fh.read())
+    except OSError:
+        pass
+    return found
+
+
 def _audit_secrets(findings: List[str], *, allow_env: bool) -> None:
     env_path = ROOT / ".env"
     if env_path.exists():
@@ -93,48 +159,67 @@ def _audit_secrets(findings: List[str], *, allow_env: bool) -> None:
             findings.append("WARN: .env exists in repo (should not be in release archives).")
 
 
-def _audit_pollution(findings: List[str], *, allow_runtime_artifacts: bool) -> None:
-    pyc = list(ROOT.rglob("*.pyc"))
+def _index_repo(root: Path) -> Dict[str, list]:
+    """
+    One scandir walk of the tree, classified for all static audits:
+      ".pyc" / "__pycache__" -> [Path], "scripts_texts" -> [Path],
+      "runtime_big" -> [(Path, size)] for runtime/ files >= RUNTIME_ARTIFACT_MIN_BYTES.
+    """
+    index: Dict[str, list] = {".pyc": [], "__pycache__": [], "scripts_texts": [], "runtime_big": []}
+    runtime_prefix = os.path.join(os.fspath(root / "runtime"), "")
+    for entry in walk_repo(root):
+        name = entry.name
+        try:
+            if entry.is_dir(follow_symlinks=False):
+                if name == "__pycache__":
+                    index["__pycache__"].append(Path(entry.path))
+                continue
+            if name.endswith(".pyc"):
+                index[".pyc"].append(Path(entry.path))
+            if not entry.is_file():
+                continue
+            if os.path.splitext(name)[1].lower() in SCRIPT_TEXT_EXTS:
+                index["scripts_texts"].append(Path(entry.path))
+            if entry.path.startswith(runtime_prefix):
+                # DirEntry.stat() is cached on the entry; only large files are kept
+                sz = entry.stat().st_size
+                if sz >= RUNTIME_ARTIFACT_MIN_BYTES:
+                    index["runtime_big"].append((Path(entry.path), sz))
+        except OSError:
+            continue
+    return index
+
+
+def _audit_pollution(findings: List[str], index: Dict[str, list], *, allow_runtime_artifacts: bool) -> None:
+    pyc = index[".pyc"]
     if pyc:
         findings.append(f"WARN: found {len(pyc)} '*.pyc' files (release pollution).")
 
-    pycache = [p for p in ROOT.rglob("__pycache__") if p.is_dir()]
+    pycache = index["__pycache__"]
     if pycache:
         findings.append(f"WARN: found {len(pycache)} '__pycache__' directories (release pollution).")
 
-    runtime = ROOT / "runtime"
-    if runtime.exists() and runtime.is_dir():
-        big = []
-        for p in runtime.rglob("*"):
-            if p.is_file():
-                sz = p.stat().st_size
-                if sz >= 200_000:
-                    big.append((p, sz))
-        if big:
-            details = ", ".join([f"{p.relative_to(ROOT)}({sz}B)" for p, sz in big])
-            if allow_runtime_artifacts:
-                findings.append(
-                    "INFO: runtime/ contains large artifacts (allowed by --allow-runtime-artifacts): " + details
-                )
-            else:
-                findings.append(
-                    "WARN: runtime/ contains large artifacts: " + details
-                )
+    big = index["runtime_big"]
+    if big:
+        details = ", ".join([f"{p.relative_to(ROOT)}({sz}B)" for p, sz in big])
+        if allow_runtime_artifacts:
+            findings.append(
+                "INFO: runtime/ contains large artifacts (allowed by --allow-runtime-artifacts): " + details
+            )
+        else:
+            findings.append(
+                "WARN: runtime/ contains large artifacts: " + details
+            )
 
 
-def _audit_scripts_commands(findings: List[str]) -> None:
-    exts = {".sh", ".cmd", ".ps1", ".bat", ".txt"}
-    candidates = []
-    for p in ROOT.rglob("*"):
-        if p.is_file() and p.suffix.lower() in exts:
-            candidates.append(p)
+def _audit_scripts_commands(findings: List[str], index: Dict[str, list]) -> None:
+    candidates = index["scripts_texts"]
 
     hits = []
     for p in candidates:
-        txt = _read_text_safe(p)
-        for name, pat in DANGEROUS_PATTERNS:
-            if pat.search(txt):
-                hits.append((name, p))
+        found = _scan_dangerous(p)
+        for i in sorted(found):
+            hits.append((DANGEROUS_PATTERNS[i][0], p))
     if hits:
         uniq = []
         seen = set()
@@ -217,8 +302,11 @@ def main() -> int:
 
     # Contracts (mandatory)
     _hr("Contracts")
-    for mod in ["scripts.check_status_contract", "scripts.check_ui_reason_string", "scripts.check_explain_trace_contract"]:
-        code, out = _run_module(mod, env=child_env)
+    contract_results: Dict[str, Tuple[int, str]] = {}
+    for stage in CONTRACT_STAGES:
+        contract_results.update(_run_modules_concurrently(stage, env=child_env))
+    for mod in CONTRACT_MODULES:
+        code, out = contract_results[mod]
         print(f"--- {mod} (exit={code}) ---")
         print(out.rstrip())
         if code != 0:
@@ -236,6 +324,9 @@ def main() -> int:
     else:
         print("--- compileall (skipped by --no-compileall) ---")
 
+    # Sequential on purpose: these tests read/write the same runtime/* state files
+    # (test_ui_no_runtime_writes checks them), so running them concurrently races.
+    # One subprocess per module: no imports, env or cwd carry over between tests.
     for mod in [
         "scripts.debug_runtime_sanity",
         "scripts.test_ui_no_runtime_writes",
@@ -245,7 +336,6 @@ def main() -> int:
         "scripts.test_state_manager",
         "scripts.test_history_retention",
     ]:
-
         code, out = _run_module(mod, env=child_env)
         print(f"--- {mod} (exit={code}) ---")
         print(out.rstrip())
@@ -269,8 +359,9 @@ def main() -> int:
     # Static audits
     _hr("Static audits")
     _audit_secrets(findings, allow_env=args.allow_env)
-    _audit_pollution(findings, allow_runtime_artifacts=args.allow_runtime_artifacts)
-    _audit_scripts_commands(findings)
+    index = _index_repo(ROOT)
+    _audit_pollution(findings, index, allow_runtime_artifacts=args.allow_runtime_artifacts)
+    _audit_scripts_commands(findings, index)
     _audit_entry_points(findings)
 
     if not findings:
@@ -4,6 +4,11 @@ import ast
 from datetime import datetime, timezone
 from pathlib import Path
 
+try:
+    import orjson  # optional: faster parse on raw bytes
+except ImportError:
+    orjson = None
+
 RUNTIME = Path("runtime")
 STATUS_FILE = RUNTIME / "status.json"
 FSM_FILE = RUNTIME / "trading_fsm.json"
@@ -14,15 +19,22 @@ LEGACY_EVENTS_FILE = Path("runtime/logs/events.jsonl")  # backward-compat
 
 
 def _read_json(p: Path):
-    return json.loads(p.read_text(encoding="utf-8"))
+    raw = p.read_bytes()
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _dumps_pretty(obj) -> bytes:
+    # UTF-8 bytes in one shot (no str -> encode round-trip on write)
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
 
 
 def _uniq(seq):
-    out = []
-    for x in seq:
-        if x not in out:
-            out.append(x)
-    return out
+    # order-preserving dedup in O(n) (dict keeps insertion order)
+    return list(dict.fromkeys(seq))
 
 
 def build_status_fallback():
@@ -50,12 +62,13 @@ def build_status_fallback():
     tech_reasons = tech.get("reasons", []) or []
 
     # Canonical why_not (no mixed raw strings like "tech stop" or "API_KEYS_MISSING")
-    why_not = []
+    # dict as an ordered set: O(1) membership instead of list scans
+    why_not = {}
 
     def _add(x: str):
         x = str(x).strip()
-        if x and x not in why_not:
-            why_not.append(x)
+        if x:
+            why_not[x] = None
 
     # Manual stop from policy is a fact
     if bool(policy.get("hard_stop_active", False)):
@@ -70,8 +83,9 @@ def build_status_fallback():
         pass
 
     # Pause reasons from FSM can contain raw tokens — normalize them
+    # (ordered list kept for detail extraction; membership tests go through a set)
     pr = [str(x).strip() for x in (pause_reasons or []) if str(x).strip()]
-    pr_low = [s.lower() for s in pr]
+    pr_low = {s.lower() for s in pr}
 
     if "manual stop" in pr_low:
         _add("MANUAL_STOP")
@@ -106,7 +120,7 @@ def build_status_fallback():
         "fsm": state,
         "mode": policy.get("mode", "unavailable"),
         "policy_hard_stop_active": bool(policy.get("hard_stop_active", False)),
-        "why_not": _uniq([str(x) for x in why_not]),
+        "why_not": _uniq(why_not),
         "ts_utc": datetime.now(timezone.utc).isoformat(),
         "source": "runtime/status.json",
     }
@@ -165,31 +179,35 @@ def check_events():
     print(f">> Checking events.jsonl ({path.as_posix()})")
 
     bad = False
-    for line in path.read_text(encoding="utf-8").splitlines():
-        if not line.strip():
-            continue
-        try:
-            e = json.loads(line)
-        except Exception:
-            try:
-                # fallback for python-style single quotes
-                e = ast.literal_eval(line)
-                if not isinstance(e, dict):
-                    raise ValueError("event is not a dict")
-            except Exception as ex:
-                # Tolerant mode: events.jsonl is an append-only log and may contain
-                # legacy/corrupt lines. We WARN and skip, but do not fail the contract.
-                print("[WARN] Skipping unparsable event line:")
-                print(line)
-                print(f"   error: {ex!r}")
+    # Stream the append-only log line by line (bytes mode: orjson parses bytes
+    # directly) instead of loading the whole file into memory.
+    with path.open("rb", buffering=1 << 20) as fh:
+        for raw in fh:
+            if not raw.strip():
                 continue
+            try:
+                e = orjson.loads(raw) if orjson is not None else json.loads(raw)
+            except Exception:
+                line = raw.decode("utf-8", errors="replace").rstrip("\r\n")
+                try:
+                    # fallback for python-style single quotes
+                    e = ast.literal_eval(line)
+                    if not isinstance(e, dict):
+                        raise ValueError("event is not a dict")
+                except Exception as ex:
+                    # Tolerant mode: events.jsonl is an append-only log and may contain
+                    # legacy/corrupt lines. We WARN and skip, but do not fail the contract.
+                    print("[WARN] Skipping unparsable event line:")
+                    print(line)
+                    print(f"   error: {ex!r}")
+                    continue
 
-        if e.get("type") == "ORDER_BLOCKED":
-            reasons = e.get("why_not", [])
-            for r in reasons:
-                if isinstance(r, dict):
-                    print(f"[FAIL] Dict reason found in event (should be str): {r}")
-                    bad = True
+            if e.get("type") == "ORDER_BLOCKED":
+                reasons = e.get("why_not", [])
+                for r in reasons:
+                    if isinstance(r, dict):
+                        print(f"[FAIL] Dict reason found in event (should be str): {r}")
+                        bad = True
 
     if bad:
         return False
@@ -204,19 +222,17 @@ if __name__ == "__main__":
     # Always build canonical snapshot from runtime/*.json and overwrite runtime/status.json
     print(">> Building canonical runtime/status.json (from runtime/*.json)")
     status = build_status_fallback()
+    payload = _dumps_pretty(status)
 
     try:
         RUNTIME.mkdir(parents=True, exist_ok=True)
-        STATUS_FILE.write_text(
-            json.dumps(status, ensure_ascii=False, indent=2),
-            encoding="utf-8",
-        )
+        STATUS_FILE.write_bytes(payload)
         print("[OK] Wrote runtime/status.json (canonical)")
     except Exception as e:
         print(f"[WARN] Failed to write runtime/status.json: {e!r}")
 
     print("--- snapshot ---")
-    print(json.dumps(status, ensure_ascii=False, indent=2))
+    print(payload.decode("utf-8"))
 
     ok &= check_status_snapshot(status)
     ok &= check_events()
@@ -13,8 +13,9 @@ from __future__ import annotations
 
 import argparse
 import os
+import shutil
 from pathlib import Path
-from typing import Iterable
+from typing import Iterable, Iterator
 
 
 ROOT = Path(__file__).resolve().parents[1]
@@ -29,46 +30,112 @@ RUNTIME_KEEP_FILES = {
 }
 
 
-def _iter_pyc(root: Path) -> Iterable[Path]:
-    yield from root.rglob("*.pyc")
+# VCS / virtualenv / tool caches: never contain release pollution we care about,
+# but can hold huge numbers of entries. Pruned at the directory level.
+# (__pycache__ is NOT pruned: its *.pyc files are what we count/clean.)
+PRUNE_DIRS = frozenset({
+    ".git",
+    ".hg",
+    ".svn",
+    ".venv",
+    "venv",
+    "node_modules",
+    ".mypy_cache",
+    ".pytest_cache",
+    ".ruff_cache",
+})
 
 
-def _iter_pycache_dirs(root: Path) -> Iterable[Path]:
-    for p in root.rglob("__pycache__"):
-        if p.is_dir():
-            yield p
+def walk_repo(root: Path, prune: frozenset[str] = PRUNE_DIRS) -> Iterator[os.DirEntry]:
+    """
+    Single os.scandir pass over the tree (symlinked dirs are not followed).
+
+    Yields every entry once; callers classify entries themselves so that one
+    traversal serves several predicates (DirEntry caches d_type, so is_dir/is_file
+    usually cost no extra syscalls). Directories named in `prune` are skipped
+    together with their contents.
+    """
+    stack = [os.fspath(root)]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                try:
+                    is_dir = entry.is_dir(follow_symlinks=False)
+                except OSError:
+                    is_dir = False
+                if is_dir:
+                    if entry.name in prune:
+                        continue
+                    stack.append(entry.path)
+                yield entry
+
+
+def _collect_py_caches(root: Path) -> tuple[list[Path], list[Path]]:
+    """*.pyc files and __pycache__ dirs in one walk."""
+    pyc: list[Path] = []
+    pycache: list[Path] = []
+    for entry in walk_repo(root):
+        name = entry.name
+        try:
+            if entry.is_dir(follow_symlinks=False):
+                if name == "__pycache__":
+                    pycache.append(Path(entry.path))
+            elif name.endswith(".pyc"):
+                pyc.append(Path(entry.path))
+        except OSError:
+            continue
+    return pyc, pycache
+
+
+RUNTIME_LOG_EXTS = (".jsonl", ".log", ".csv")
 
 
 def _iter_runtime_logs(runtime: Path) -> Iterable[Path]:
     """
     Files that are safe to remove ONLY on explicit request.
     We keep status.json and key config files.
+
+    Scope: top-level runtime/ files plus everything under runtime/logs/
+    (one scandir pass each). Matching is the same as the former
+    glob("*.jsonl"/"*.log"/"*.csv") + rglob: dotfiles and hidden subdirs
+    included, case-sensitive suffix except on Windows, logs/ may be a symlink.
     """
-    if not runtime.exists() or not runtime.is_dir():
+    if not runtime.is_dir():
         return []
-    out: list[Path] = []
 
-    # top-level patterns
-    for pat in ("*.jsonl", "*.log", "*.csv"):
-        out.extend([p for p in runtime.glob(pat) if p.is_file()])
+    def _is_log(entry: os.DirEntry) -> bool:
+        name = entry.name
+        if name in RUNTIME_KEEP_FILES:
+            return False
+        if not os.path.normcase(name).endswith(RUNTIME_LOG_EXTS):
+            return False
+        try:
+            return entry.is_file()
+        except OSError:
+            return False
+
+    out: list[Path] = []
+    logs_dir: str | None = None
+    try:
+        with os.scandir(runtime) as it:
+            for entry in it:
+                if entry.name == "logs" and entry.is_dir():
+                    logs_dir = entry.path
+                elif _is_log(entry):
+                    out.append(Path(entry.path))
+    except OSError:
+        return out
 
     # nested logs folders (common)
-    logs_dir = runtime / "logs"
-    if logs_dir.exists() and logs_dir.is_dir():
-        for pat in ("*.jsonl", "*.log", "*.csv"):
-            out.extend([p for p in logs_dir.rglob(pat) if p.is_file()])
-
-    # filter keep files
-    filtered: list[Path] = []
-    for p in out:
-        if p.name in RUNTIME_KEEP_FILES:
-            continue
-        # keep any runtime state/config json (conservative)
-        if p.suffix.lower() == ".json":
-            continue
-        filtered.append(p)
+    if logs_dir is not None:
+        # no pruning here: rglob descended into every subdir of logs/
+        out.extend(Path(e.path) for e in walk_repo(Path(logs_dir), prune=frozenset()) if _is_log(e))
 
-    return filtered
+    return out
 
 
 def _rm_file(p: Path, dry_run: bool) -> bool:
@@ -85,20 +152,8 @@ def _rm_dir(p: Path, dry_run: bool) -> bool:
     try:
         if dry_run:
             return True
-        # remove contents then dir
-        for child in sorted(p.rglob("*"), reverse=True):
-            try:
-                if child.is_file():
-                    child.unlink(missing_ok=True)
-                elif child.is_dir():
-                    child.rmdir()
-            except Exception:
-                # ignore and continue; we'll report failure at the end if dir still exists
-                pass
-        try:
-            p.rmdir()
-        except Exception:
-            pass
+        # errors are ignored here; failure is reported if the dir still exists
+        shutil.rmtree(p, ignore_errors=True)
         return not p.exists()
     except Exception:
         return False
@@ -128,8 +183,10 @@ def main() -> int:
     print(f"dry_run: {dry}")
     print(f"runtime_logs: {bool(args.runtime_logs)}")
 
+    pyc_found, pycache_found = _collect_py_caches(ROOT)
+
     # --- pyc files
-    pyc_files = sorted(set(_iter_pyc(ROOT)))
+    pyc_files = sorted(pyc_found)
     pyc_ok = 0
     pyc_fail = 0
     for p in pyc_files:
@@ -144,7 +201,7 @@ def main() -> int:
             pyc_fail += 0 if ok else 1
 
     # --- __pycache__ dirs
-    pycache_dirs = sorted(set(_iter_pycache_dirs(ROOT)))
+    pycache_dirs = sorted(pycache_found)
     dir_ok = 0
     dir_fail = 0
     for d in pycache_dirs:
@@ -15,13 +15,17 @@ from ui.events.types import Event, EVT_SNAPSHOT  # noqa: E402
 
 
 def _format_snapshot_summary(snapshot: dict | None) -> str:
-    snapshot = snapshot or {}
-    version = snapshot.get("version") or snapshot.get("state_version")
-    positions = snapshot.get("positions") or {}
+    if not snapshot:
+        return "version=None, positions=0"
+    # fallback lookup only when "version" is actually absent
+    version = snapshot.get("version")
+    if version is None:
+        version = snapshot.get("state_version")
+    positions = snapshot.get("positions")
     if isinstance(positions, dict):
         positions_count = len(positions)
     else:
-        positions_count = None
+        positions_count = None if positions else 0
     return f"version={version!r}, positions={positions_count}"
 
 
@@ -92,8 +92,10 @@ def _evaluate(snap: Dict[str, Any], status: Dict[str, Any], safe_lock: bool) ->
     return ("OK", 0, reasons)
 
 
-def main() -> None:
-    pretty = ("--pretty" in sys.argv) or ("-p" in sys.argv)
+def main(argv: list[str] | None = None) -> int:
+    """Print one health snapshot and return its exit code (in-process friendly)."""
+    args = sys.argv[1:] if argv is None else argv
+    pretty = ("--pretty" in args) or ("-p" in args)
 
     snap = get_health_snapshot_for_core()
     safe_lock = _is_safe_hard_lock()
@@ -116,8 +118,8 @@ def main() -> None:
     else:
         print(json.dumps(out, ensure_ascii=False))
 
-    raise SystemExit(code)
+    return code
 
 
 if __name__ == "__main__":
-    main()
+    raise SystemExit(main())
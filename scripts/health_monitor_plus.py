@@ -1,28 +1,68 @@
 #!/usr/bin/env python3
 # scripts/health_monitor_plus.py
 # v2.2.104 — wrapper over Health Contract (snapshot-only; no file logs)
+#
+# By default the contract runs in-process (no interpreter spawn per tick);
+# pass --isolate to run it as a separate subprocess as before.
 
+import signal
 import sys
-import time
 import subprocess
+import threading
 import os
 
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
 
-def one_tick() -> int:
+
+SUBPROCESS_TIMEOUT_SEC = 300
+
+
+def _one_tick_subprocess() -> int:
+    # Stream child output line by line (no buffering of the whole transcript);
+    # a timer kills the child if the whole tick exceeds SUBPROCESS_TIMEOUT_SEC.
     cmd = [sys.executable, os.path.join("scripts", "health_contract.py")]
     try:
-        out = subprocess.check_output(cmd, stderr=subprocess.STDOUT, text=True, timeout=300)
-        print(out.strip())
-        return 0
-    except subprocess.CalledProcessError as e:
-        print(e.output.strip())
-        return int(e.returncode or 1)
+        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+    except Exception as e:
+        print(f"[HEALTH_PLUS] Exception: {e}")
+        return 1
+
+    timer = threading.Timer(SUBPROCESS_TIMEOUT_SEC, proc.kill)
+    timer.start()
+    try:
+        for line in proc.stdout:
+            sys.stdout.write(line)
+        sys.stdout.flush()
+        code = proc.wait()
+    except Exception as e:
+        proc.kill()
+        print(f"[HEALTH_PLUS] Exception: {e}")
+        return 1
+    finally:
+        timer.cancel()
+        proc.stdout.close()
+
+    if code < 0:
+        print(f"[HEALTH_PLUS] health_contract terminated by signal {-code} (timeout {SUBPROCESS_TIMEOUT_SEC}s?)")
+        return 1
+    return int(code)
+
+
+def one_tick(isolate: bool = False) -> int:
+    if isolate:
+        return _one_tick_subprocess()
+    try:
+        from scripts import health_contract
+        return int(health_contract.main([]))
     except Exception as e:
         print(f"[HEALTH_PLUS] Exception: {e}")
         return 1
 
 
 if __name__ == "__main__":
+    isolate = "--isolate" in sys.argv
     if "--loop" in sys.argv:
         interval = 60
         try:
@@ -31,8 +71,14 @@ if __name__ == "__main__":
         except Exception:
             interval = int(os.environ.get("MTR_HEALTH_INTERVAL", "60") or "60")
 
-        while True:
-            one_tick()
-            time.sleep(max(5, interval))
+        # Event-based wait: SIGTERM/SIGINT stop the loop between ticks instead of
+        # killing it mid-tick, and the wait can be woken externally later on.
+        stop = threading.Event()
+        signal.signal(signal.SIGTERM, lambda *_: stop.set())
+        signal.signal(signal.SIGINT, lambda *_: stop.set())
+
+        while not stop.is_set():
+            one_tick(isolate)
+            stop.wait(max(5, interval))
     else:
-        raise SystemExit(one_tick())
+        raise SystemExit(one_tick(isolate))
@@ -1,7 +1,8 @@
 
 # scripts/real_buy_market.py — CLI bridge for UI button (fixed sys.path root)
 from __future__ import annotations
-import os, sys, getpass, json, math, pathlib
+import os, sys, getpass, json, pathlib, functools
+from decimal import Decimal
 
 # ensure project root on sys.path (so "core" is importable when run via path)
 ROOT = pathlib.Path(__file__).resolve().parents[1]
@@ -15,9 +16,32 @@ try:
 except Exception:
     pass
 
+@functools.lru_cache(maxsize=64)
+def _step_ticks(step: float) -> tuple[int, int]:
+    # (step in integer ticks, ticks per unit) for ticks of 10**-dp,
+    # e.g. 0.001 -> (1, 1000); repr is the shortest exact form of the step
+    exp = Decimal(repr(step)).normalize().as_tuple().exponent
+    dp = -exp if exp < 0 else 0
+    scale = 10 ** dp
+    return int(Decimal(repr(step)).scaleb(dp)), scale
+
 def step_round(v, step):
+    # floor to the step in integer ticks (float v/step misrounds,
+    # e.g. floor(0.3/0.1) == 2). v*scale carries float noise
+    # (0.29*100 == 28.999999999999996): take the nearest tick and step back
+    # one only if it lies above v (int/int division is correctly rounded)
     if not step or step <= 0: return v
-    return math.floor(v/step)*step
+    step_ticks, scale = _step_ticks(step)
+    v_ticks = round(v * scale)
+    if v_ticks / scale > v:
+        v_ticks -= 1
+    return (v_ticks // step_ticks) * step_ticks / scale
+
+@functools.lru_cache(maxsize=1)
+def _client():
+    # one public client per process: reuses its requests.Session (keep-alive)
+    from binance.client import Client
+    return Client()
 
 def read_safe_code():
     p = os.path.join("runtime", "safe_unlock.key")
@@ -34,13 +58,19 @@ def main():
         sys.exit(2)
     symbol = sys.argv[1].upper()
     qty = float(sys.argv[2])
-    ask_mode = ("--ask" in sys.argv)
+    # flags after SYMBOL QTY, parsed in one pass: --ask, confirm=TOKEN
+    ask_mode = False
+    confirm_token = None
+    for a in sys.argv[3:]:
+        if a == "--ask":
+            ask_mode = True
+        elif a.strip().lower().startswith("confirm="):
+            confirm_token = a.split("=", 1)[1].strip()
 
     # get public price (optional)
     price = None
     try:
-        from binance.client import Client
-        price = float(Client().get_symbol_ticker(symbol=symbol)["price"])
+        price = float(_client().get_symbol_ticker(symbol=symbol)["price"])
     except Exception:
         pass
 
@@ -59,11 +89,7 @@ def main():
     # Two-step manual confirm (v2.2.105):
     # 1) run without confirm=... -> prints token and exits without trading
     # 2) rerun with confirm=TOKEN  -> order is allowed (still SAFE-gated)
-    confirm_token = None
-    for a in sys.argv[1:]:
-        if isinstance(a, str) and a.strip().lower().startswith("confirm="):
-            confirm_token = a.split("=", 1)[1].strip()
-
+    #    (confirm_token is parsed together with the flags above)
     if not confirm_token:
         from core.risky_confirm import RiskyConfirmService
         cmd_text = f"/real_buy_market {symbol} qty={rq}"
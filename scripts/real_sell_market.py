@@ -5,8 +5,13 @@
 # - Log chosen filter source (e.g., "(LOT_SIZE fallback)")
 # - SAFE: asks code by default; supports --no-ask
 from __future__ import annotations
-import os, sys, json, getpass, pathlib
-from decimal import Decimal, getcontext, ROUND_DOWN
+import os, sys, json, getpass, hmac, pathlib, functools
+from decimal import Decimal, getcontext, ROUND_CEILING, ROUND_FLOOR
+
+try:
+    import orjson  # optional: parses bytes directly (exchange_info is large)
+except ImportError:
+    orjson = None
 
 getcontext().prec = 28
 
@@ -23,43 +28,126 @@ except Exception:
 
 def d(x): return Decimal(str(x))
 
+def _loads(raw: bytes):
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+SAFE_FILE_MAX_BYTES = 256  # unlock code is short; never read more than this
+
 def read_safe_file() -> str | None:
     p = ROOT / "runtime" / "safe_unlock.key"
+    # one bounded os.read: no text-IO wrapper, no unbounded read of a rotated file
     try:
-        return p.read_text(encoding="utf-8").strip()
+        fd = os.open(p, os.O_RDONLY)
+        try:
+            buf = os.read(fd, SAFE_FILE_MAX_BYTES)
+        finally:
+            os.close(fd)
+        return buf.strip().decode("utf-8")
     except Exception:
         return None
 
-def load_exchange_info() -> dict | None:
-    # Prefer local snapshot
-    p = ROOT / "runtime" / "exchange_info.json"
-    try:
-        import json
-        if p.exists():
-            return json.loads(p.read_text(encoding="utf-8"))
-    except Exception:
-        pass
-    # Fallback to live
+EXCHANGE_INFO_PATH = ROOT / "runtime" / "exchange_info.json"
+
+@functools.lru_cache(maxsize=1)
+def _read_exchange_info_snapshot(path: str, mtime_ns: int) -> dict | None:
+    # keyed on mtime_ns: a refreshed snapshot invalidates the cached parse
     try:
-        from binance.client import Client
-        cli = Client()
-        return cli.get_exchange_info()
+        with open(path, "rb") as f:
+            return _loads(f.read())
     except Exception:
         return None
 
-def find_symbol_filters(symbol: str) -> dict:
-    info = load_exchange_info() or {}
+def _index_symbols(info: dict) -> dict:
+    """{SYMBOL: {filterType: filter}} built in one pass over the snapshot."""
     symbols = info.get("symbols") or info.get("symbolsData") or []
     if isinstance(symbols, dict):
         symbols = symbols.values()
+    index: dict = {}
     for s in symbols:
-        if (s.get("symbol") or "").upper() == symbol.upper():
-            flt = {}
-            for f in s.get("filters", []):
-                ftype = f.get("filterType") or f.get("filter_type") or ""
-                flt[ftype] = f
-            return flt
-    return {}
+        sym = (s.get("symbol") or "").upper()
+        if sym in index:
+            continue  # first entry wins, as with the old linear scan
+        flt = {}
+        for f in s.get("filters", []):
+            ftype = f.get("filterType") or f.get("filter_type") or ""
+            flt[ftype] = f
+        index[sym] = flt
+    return index
+
+# Normalized {SYMBOL: {filterType: filter}} persisted next to the snapshot, so a
+# fresh CLI run loads the small map instead of re-parsing the full exchange_info.
+EXCHANGE_INDEX_PATH = ROOT / "runtime" / "exchange_info.normalized.json"
+
+def _read_persisted_index(mtime_ns: int) -> dict | None:
+    try:
+        with open(EXCHANGE_INDEX_PATH, "rb") as f:
+            data = _loads(f.read())
+    except Exception:
+        return None
+    if not isinstance(data, dict) or data.get("source_mtime_ns") != mtime_ns:
+        return None  # stale: exchange_info.json was refreshed since
+    symbols = data.get("symbols_by_name")
+    return symbols if isinstance(symbols, dict) else None
+
+def _persist_index(index: dict, mtime_ns: int) -> None:
+    # best-effort cache: failure only means the next run re-indexes
+    payload = {"source_mtime_ns": mtime_ns, "symbols_by_name": index}
+    try:
+        buf = orjson.dumps(payload) if orjson is not None else json.dumps(payload).encode("utf-8")
+        tmp = EXCHANGE_INDEX_PATH.with_suffix(".json.tmp")
+        tmp.write_bytes(buf)
+        os.replace(tmp, EXCHANGE_INDEX_PATH)
+    except Exception:
+        pass
+
+@functools.lru_cache(maxsize=1)
+def _snapshot_symbol_index(path: str, mtime_ns: int) -> dict | None:
+    index = _read_persisted_index(mtime_ns)
+    if index is not None:
+        return index
+    info = _read_exchange_info_snapshot(path, mtime_ns)
+    if not info:
+        return None
+    index = _index_symbols(info)
+    _persist_index(index, mtime_ns)
+    return index
+
+def _snapshot_mtime_ns() -> int | None:
+    try:
+        return os.stat(EXCHANGE_INFO_PATH).st_mtime_ns
+    except OSError:
+        return None
+
+@functools.lru_cache(maxsize=1)
+def _client():
+    # one public client per process: reuses its requests.Session (keep-alive)
+    from binance.client import Client
+    return Client()
+
+def _load_exchange_info_live() -> dict | None:
+    try:
+        return _client().get_exchange_info()
+    except Exception:
+        return None
+
+def load_exchange_info() -> dict | None:
+    # Prefer local snapshot (parsed once per file version)
+    mtime_ns = _snapshot_mtime_ns()
+    if mtime_ns is not None:
+        info = _read_exchange_info_snapshot(str(EXCHANGE_INFO_PATH), mtime_ns)
+        if info is not None:
+            return info
+    # Fallback to live
+    return _load_exchange_info_live()
+
+def find_symbol_filters(symbol: str) -> dict:
+    index = None
+    mtime_ns = _snapshot_mtime_ns()
+    if mtime_ns is not None:
+        index = _snapshot_symbol_index(str(EXCHANGE_INFO_PATH), mtime_ns)
+    if index is None:
+        index = _index_symbols(_load_exchange_info_live() or {})
+    return dict(index.get(symbol.upper()) or {})
 
 def extract_numbers(filters: dict) -> tuple[Decimal, Decimal, Decimal, str]:
     # Try MARKET_LOT_SIZE first
@@ -90,31 +178,53 @@ def extract_numbers(filters: dict) -> tuple[Decimal, Decimal, Decimal, str]:
 
     return step, min_qty, min_notional, src
 
+TICKER_PRICE_URL = "https://api.binance.com/api/v3/ticker/price"
+
+@functools.lru_cache(maxsize=1)
+def _session():
+    # single keep-alive connection to api.binance.com (public, unsigned)
+    import requests
+    from requests.adapters import HTTPAdapter
+    s = requests.Session()
+    s.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=1))
+    return s
+
 def public_price(symbol: str) -> Decimal | None:
+    # Direct GET /api/v3/ticker/price: no full Client init for one number.
+    # Binance returns the price as a string, so Decimal conversion stays exact.
     try:
-        from binance.client import Client
-        cli = Client()
-        t = cli.get_symbol_ticker(symbol=symbol)
-        return d(t["price"])
+        r = _session().get(TICKER_PRICE_URL, params={"symbol": symbol.upper()}, timeout=5)
+        r.raise_for_status()
+        return d(_loads(r.content)["price"])
     except Exception:
         return None
 
+@functools.lru_cache(maxsize=64)
+def _step_dp(step: Decimal) -> int:
+    # decimal places of the (normalized) step, e.g. 0.00100000 -> 3
+    exp = step.normalize().as_tuple().exponent
+    return -exp if exp < 0 else 0
+
+# Quantization in integer "ticks" of 10**-dp: one exact scale of x, then plain
+# int floor/ceil division by the integer step instead of Decimal division.
 def quant_floor(x: Decimal, step: Decimal) -> Decimal:
     if step <= 0: return x
-    return (x / step).to_integral_value(rounding=ROUND_DOWN) * step
+    dp = _step_dp(step)
+    step_ticks = int(step.scaleb(dp))
+    x_ticks = int(x.scaleb(dp).to_integral_value(rounding=ROUND_FLOOR))
+    return Decimal((x_ticks // step_ticks) * step_ticks).scaleb(-dp)
 
 def quant_ceil(x: Decimal, step: Decimal) -> Decimal:
     if step <= 0: return x
-    q = (x / step).to_integral_value(rounding=ROUND_DOWN) * step
-    if q < x: q += step
-    return q
+    dp = _step_dp(step)
+    step_ticks = int(step.scaleb(dp))
+    x_ticks = int(x.scaleb(dp).to_integral_value(rounding=ROUND_CEILING))
+    return Decimal(-(-x_ticks // step_ticks) * step_ticks).scaleb(-dp)
 
 def format_qty(q: Decimal, step: Decimal) -> str:
     if step <= 0:
         return format(q.normalize(), 'f')
-    s = format(step.normalize(), 'f')
-    dp = len(s.split('.')[1]) if '.' in s else 0
-    return f"{q:.{dp}f}"
+    return f"{q:.{_step_dp(step)}f}"
 
 def main(argv=None):
     argv = sys.argv[1:] if argv is None else argv
@@ -123,7 +233,14 @@ def main(argv=None):
         sys.exit(2)
     symbol = argv[0].upper()
     qty_in = d(argv[1])
-    ask_mode = ("--no-ask" not in argv[2:])
+    # flags after SYMBOL QTY, parsed in one pass: --no-ask, confirm=TOKEN
+    ask_mode = True
+    confirm_token = None
+    for a in argv[2:]:
+        if a == "--no-ask":
+            ask_mode = False
+        elif a.strip().lower().startswith("confirm="):
+            confirm_token = a.split("=", 1)[1].strip()
 
     # SAFE flag
     if (ROOT / "SAFE_MODE").exists():
@@ -155,18 +272,14 @@ def main(argv=None):
     safe_file = read_safe_file()
     if ask_mode:
         code = getpass.getpass("SAFE code: ").strip()
-        if safe_file and code != safe_file:
+        # constant-time compare (no timing side channel on the unlock code)
+        if safe_file and not hmac.compare_digest(code.encode("utf-8"), safe_file.encode("utf-8")):
             raise PermissionError("SAFE is ON — invalid unlock code")
         safe_code = code
     else:
         safe_code = safe_file
 
-    # Two-step manual confirm (v2.2.105):
-    confirm_token = None
-    for a in sys.argv[1:]:
-        if isinstance(a, str) and a.strip().lower().startswith("confirm="):
-            confirm_token = a.split("=", 1)[1].strip()
-
+    # Two-step manual confirm (v2.2.105): confirm_token parsed with the flags above
     if not confirm_token:
         from core.risky_confirm import RiskyConfirmService
         cmd_text = f"/real_sell_market {symbol} qty={float(q)}"
@@ -7,7 +7,6 @@
 
 from __future__ import annotations
 
-import hashlib
 import sys
 import time
 from pathlib import Path
@@ -18,26 +17,15 @@ ROOT = Path(__file__).resolve().parents[1]
 RUNTIME = ROOT / "runtime"
 
 
-def _sha256(path: Path) -> str:
-    h = hashlib.sha256()
-    with path.open("rb") as f:
-        while True:
-            b = f.read(1024 * 1024)
-            if not b:
-                break
-            h.update(b)
-    return h.hexdigest()
-
-
 def _snap(path: Path) -> Dict[str, Any]:
     if not path.exists():
         return {"exists": False}
+    # metadata only: any write bumps mtime_ns, so no content hashing is needed
     st = path.stat()
     return {
         "exists": True,
         "size": int(st.st_size),
-        "mtime": float(st.st_mtime),
-        "sha256": _sha256(path),
+        "mtime_ns": int(st.st_mtime_ns),
     }
 
 
@@ -46,7 +34,7 @@ def _diff(before: Dict[str, Any], after: Dict[str, Any]) -> str:
         return f"exists: {before.get('exists')} -> {after.get('exists')}"
     if not before.get("exists"):
         return ""
-    fields = ["size", "mtime", "sha256"]
+    fields = ["size", "mtime_ns"]
     changed = []
     for k in fields:
         if before.get(k) != after.get(k):
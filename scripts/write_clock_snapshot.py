@@ -1,30 +1,83 @@
 from __future__ import annotations
 
 import json
+import os
+import sys
+import time
 from pathlib import Path
 
+try:
+    import orjson  # optional: serializes straight to UTF-8 bytes
+except ImportError:
+    orjson = None
+
 from core.system_clock import SystemClock
 from core.schema_ids import SchemaIds, SchemaVersions
 
 
-def main() -> int:
-    root_dir = Path(__file__).resolve().parents[1]
-    runtime_dir = root_dir / "runtime"
-    runtime_dir.mkdir(parents=True, exist_ok=True)
+def _dumps(payload: dict) -> bytes:
+    if orjson is not None:
+        try:
+            return orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            pass  # unsupported type for orjson -> stdlib
+    return json.dumps(payload, ensure_ascii=False, indent=2).encode("utf-8")
 
-    meta = SystemClock.meta_dict()
-    payload = {
+
+def _write_atomic(out_path: Path, buf: bytes) -> None:
+    # readers never see a half-written snapshot: tmp file + rename
+    tmp = out_path.with_suffix(".json.tmp")
+    tmp.write_bytes(buf)
+    os.replace(tmp, out_path)
+
+
+def _build_payload() -> dict:
+    return {
         "_schema": {"name": SchemaIds.CLOCK_SNAPSHOT, "version": SchemaVersions.V1},
         "ts_wall_ms": SystemClock.now_wall_ms(),
         "ts_exchange_ms": SystemClock.now_exchange_ms(),
-        "meta": meta,
+        "meta": SystemClock.meta_dict(),
     }
 
-    out_path = runtime_dir / "clock_snapshot.json"
-    out_path.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+
+def _out_path() -> Path:
+    root_dir = Path(__file__).resolve().parents[1]
+    runtime_dir = root_dir / "runtime"
+    runtime_dir.mkdir(parents=True, exist_ok=True)
+    return runtime_dir / "clock_snapshot.json"
+
+
+def main() -> int:
+    out_path = _out_path()
+    _write_atomic(out_path, _dumps(_build_payload()))
     print(f"[clock] -> {out_path}")
     return 0
 
 
+def main_loop(interval_s: float, count: int) -> int:
+    """
+    Write `count` snapshots `interval_s` apart in one process
+    (instead of paying interpreter start + imports per write from cron).
+    The payload is rebuilt on every tick: timestamps must be fresh.
+    """
+    out_path = _out_path()
+    for i in range(max(0, int(count))):
+        if i:
+            time.sleep(max(0.0, float(interval_s)))
+        _write_atomic(out_path, _dumps(_build_payload()))
+    print(f"[clock] -> {out_path} x{max(0, int(count))}")
+    return 0
+
+
 if __name__ == "__main__":
+    if "--count" in sys.argv:
+        try:
+            i = sys.argv.index("--count")
+            n = int(sys.argv[i + 1])
+            j = sys.argv.index("--interval") if "--interval" in sys.argv else -1
+            interval = float(sys.argv[j + 1]) if j >= 0 else 1.0
+        except (IndexError, ValueError):
+            print("Usage: python -m scripts.write_clock_snapshot [--count N [--interval SEC]]")
+            raise SystemExit(2)
+        raise SystemExit(main_loop(interval, n))
     raise SystemExit(main())
@@ -4,6 +4,11 @@ from runtime.state_manager import StateManager
 from core.position_manager import PositionManager
 import json, os
 
+try:
+    import orjson  # optional: faster settings.json parse/serialize on bytes
+except ImportError:
+    orjson = None
+
 from core.panic_facade import activate_panic
 from core.autonomy_policy import AutonomyPolicyStore
 from core.trading_state_machine import TradingStateMachine
@@ -12,6 +17,8 @@ from core.command_router import CommandRouter
 from core.risky_confirm import RiskyConfirmService
 
 def install_commands(bot, get_price: Callable[[str], float]):
+    # менеджеры и сервисы создаются один раз на установку и переиспользуются всеми
+    # командами; результаты (/status, /tpsl) не кэшируем — всегда свежее состояние
     state = StateManager()
     pm = PositionManager(state)
 
@@ -23,41 +30,41 @@ def install_commands(bot, get_price: Callable[[str], float]):
 
     def cmd_status(update, context):
         payload = status_service.build_status().to_dict()
-        # короткий канонический вывод
-        lines = []
-        lines.append(f"state: {payload['state']}")
-        lines.append(f"mode: {payload['mode']}")
-        lines.append(f"trading: {'YES' if payload['is_trading'] else 'NO'}")
+        # короткий канонический вывод: статичный блок одним f-string,
+        # списки (why/gate_reasons) — через join
+        parts = [
+            f"state: {payload['state']}\n"
+            f"mode: {payload['mode']}\n"
+            f"trading: {'YES' if payload['is_trading'] else 'NO'}"
+        ]
         if not payload["is_trading"]:
             why = payload.get("why_not") or []
             if why:
-                lines.append("why:")
-                for r in why[:3]:
-                    lines.append(f"- {r}")
+                parts.append("why:\n" + "\n".join(f"- {r}" for r in why[:3]))
         gate = payload.get("gate")
         if isinstance(gate, dict) and gate:
             decision = str(gate.get("decision") or "").upper() or "N/A"
             reasons = gate.get("reasons") or []
             if not isinstance(reasons, list):
                 reasons = []
-            lines.append(f"gate: {decision}")
+            parts.append(f"gate: {decision}")
             if reasons:
-                lines.append("gate_reasons:")
-                for r in reasons[:3]:
-                    lines.append(f"- {r}")
+                parts.append("gate_reasons:\n" + "\n".join(f"- {r}" for r in reasons[:3]))
         pos = payload.get("open_position")
         if pos:
-            lines.append("open_position:")
-            lines.append(f"- symbol: {pos.get('symbol')}")
-            lines.append(f"- side: {pos.get('side')}")
-            lines.append(f"- entry: {pos.get('entry')}")
-            lines.append(f"- current: {pos.get('current')}")
-            lines.append(f"- pnl: {pos.get('pnl')}")
-        update.message.reply_text("\n".join(lines))
+            parts.append(
+                "open_position:\n"
+                f"- symbol: {pos.get('symbol')}\n"
+                f"- side: {pos.get('side')}\n"
+                f"- entry: {pos.get('entry')}\n"
+                f"- current: {pos.get('current')}\n"
+                f"- pnl: {pos.get('pnl')}"
+            )
+        update.message.reply_text("\n".join(parts))
 
-    def _is_enabled():
-        # включать только когда будет готов RiskyConfirm (по канону)
-        return os.environ.get("MONTRIX_ENABLE_RISKY_CMDS", "0") == "1"
+    # включать только когда будет готов RiskyConfirm (по канону);
+    # читается один раз при установке команд
+    risky_enabled = os.environ.get("MONTRIX_ENABLE_RISKY_CMDS", "0") == "1"
 
     def _extract_confirm_token(args):
         """
@@ -108,29 +115,51 @@ def install_commands(bot, get_price: Callable[[str], float]):
         )
         return None
 
-    def cmd_pause(update, context):
-        if not _is_enabled():
-            update.message.reply_text("Risky commands disabled (enable MONTRIX_ENABLE_RISKY_CMDS=1).")
-            return
-        _risky_two_step(update, "/pause", context.args or [])
+    def _risky_cmd(base_cmd: str):
+        def handler(update, context):
+            if not risky_enabled:
+                update.message.reply_text("Risky commands disabled (enable MONTRIX_ENABLE_RISKY_CMDS=1).")
+                return
+            _risky_two_step(update, base_cmd, context.args or [])
+        return handler
 
-    def cmd_stop(update, context):
-        if not _is_enabled():
-            update.message.reply_text("Risky commands disabled (enable MONTRIX_ENABLE_RISKY_CMDS=1).")
-            return
-        _risky_two_step(update, "/stop", context.args or [])
-
-    def cmd_resume(update, context):
-        if not _is_enabled():
-            update.message.reply_text("Risky commands disabled (enable MONTRIX_ENABLE_RISKY_CMDS=1).")
-            return
-        _risky_two_step(update, "/resume", context.args or [])
+    settings_path = os.path.join("runtime", "settings.json")
+    # разобранный settings.json, инвалидируется по mtime_ns (один stat вместо парсинга)
+    settings_cache = {"mtime_ns": None, "data": {}}
 
-    def cmd_set_mode(update, context):
-        if not _is_enabled():
-            update.message.reply_text("Risky commands disabled (enable MONTRIX_ENABLE_RISKY_CMDS=1).")
-            return
-        _risky_two_step(update, "/set_mode", context.args or [])
+    def _load_settings() -> dict:
+        try:
+            mtime_ns = os.stat(settings_path).st_mtime_ns
+        except OSError:
+            return {}
+        if mtime_ns != settings_cache["mtime_ns"]:
+            try:
+                with open(settings_path, "rb") as f:
+                    raw = f.read()
+                data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+            except Exception:
+                data = {}
+            settings_cache["mtime_ns"] = mtime_ns
+            settings_cache["data"] = data if isinstance(data, dict) else {}
+        return settings_cache["data"]
+
+    def _save_settings(cfg: dict) -> None:
+        if orjson is not None:
+            data = orjson.dumps(cfg, option=orjson.OPT_INDENT_2)
+        else:
+            data = json.dumps(cfg, ensure_ascii=False, indent=2).encode("utf-8")
+        # атомарно: tmp + os.replace (сбой посреди записи не портит settings.json)
+        tmp = settings_path + ".tmp"
+        try:
+            with open(tmp, "wb") as f:
+                f.write(data)
+            os.replace(tmp, settings_path)
+            settings_cache["mtime_ns"] = os.stat(settings_path).st_mtime_ns
+            settings_cache["data"] = cfg
+        except BaseException:
+            # cfg мог быть изменён на месте — кэш больше не соответствует файлу
+            settings_cache["mtime_ns"] = None
+            raise
 
     def cmd_autoloop(update, context):
         args = context.args or []
@@ -139,14 +168,9 @@ def install_commands(bot, get_price: Callable[[str], float]):
             return
         on = args[0].lower() == "on"
         os.makedirs("runtime", exist_ok=True)
-        try:
-            with open("runtime/settings.json", "r", encoding="utf-8") as f:
-                cfg = json.load(f)
-        except Exception:
-            cfg = {}
+        cfg = _load_settings()
         cfg.setdefault("tpsl_autoloop", {})["enabled"] = on
-        with open("runtime/settings.json", "w", encoding="utf-8") as f:
-            json.dump(cfg, f, ensure_ascii=False, indent=2)
+        _save_settings(cfg)
         update.message.reply_text(f"TPSL-autoloop: {'ON' if on else 'OFF'}")
 
     def cmd_update_tp(update, context):
@@ -209,20 +233,22 @@ def install_commands(bot, get_price: Callable[[str], float]):
         except Exception as e:
             update.message.reply_text(f"PANIC-KILL failed: {e!r}")
 
-    try:
-        bot.add_command("autoloop", cmd_autoloop)
-        bot.add_command("update_tp", cmd_update_tp)
-        bot.add_command("update_sl", cmd_update_sl)
-        bot.add_command("tpsl", cmd_tpsl)
-        bot.add_command("panic", cmd_panic)
-        bot.add_command("status", cmd_status)
-
+    commands = {
+        "autoloop": cmd_autoloop,
+        "update_tp": cmd_update_tp,
+        "update_sl": cmd_update_sl,
+        "tpsl": cmd_tpsl,
+        "panic": cmd_panic,
+        "status": cmd_status,
         # risky — отключены по умолчанию до RiskyConfirm wiring
-        bot.add_command("pause", cmd_pause)
-        bot.add_command("stop", cmd_stop)
-        bot.add_command("resume", cmd_resume)
-        bot.add_command("set_mode", cmd_set_mode)
+        "pause": _risky_cmd("/pause"),
+        "stop": _risky_cmd("/stop"),
+        "resume": _risky_cmd("/resume"),
+        "set_mode": _risky_cmd("/set_mode"),
+    }
 
+    try:
+        for name, handler in commands.items():
+            bot.add_command(name, handler)
     except Exception:
         pass
-
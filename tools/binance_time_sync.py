@@ -11,8 +11,10 @@ References (official):
 from __future__ import annotations
 import time, json, os, math, threading
 from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 import requests
+from requests.adapters import HTTPAdapter
 
 RUNTIME_DIR = os.path.normpath(os.path.join(os.path.dirname(__file__), "..", "runtime"))
 OFFSET_FILE = os.path.join(RUNTIME_DIR, "time_offset.json")
@@ -27,44 +29,204 @@ class TimeStatus:
     offset_ms: int
     recv_window_ms: int
 
+# Spot API mirrors; RTT differs noticeably by location.
+SPOT_HOSTS = (
+    "https://api.binance.com",
+    "https://api1.binance.com",
+    "https://api2.binance.com",
+    "https://api3.binance.com",
+    "https://api4.binance.com",
+)
+PROBE_TIMEOUT_S = 2.0
+
 _session = requests.Session()
+# keep-alive pool: TLS handshake paid once per host, not per sync
+_session.mount("https://", HTTPAdapter(pool_connections=len(SPOT_HOSTS), pool_maxsize=8))
 _lock = threading.Lock()
 
+# Hosts in preferred order (lowest ping RTT first). Until the first probe finishes,
+# SPOT_HOSTS order is used: the probe runs in a background thread, so the first
+# sync (order preflight) never waits for it. A host that fails a request is moved
+# to the end, so server_time() fails over instead of retrying a dead mirror.
+_host_rank: Optional[tuple[str, ...]] = None  # replaced as a whole tuple
+_probe_started = False
+_probe_lock = threading.Lock()
+
+def _ping_rtt(host: str) -> float:
+    t0 = time.perf_counter()
+    try:
+        r = _session.get(host + "/api/v3/ping", timeout=PROBE_TIMEOUT_S)
+        r.raise_for_status()
+    except Exception:
+        return math.inf
+    return time.perf_counter() - t0
+
+def _probe_hosts() -> tuple[str, ...]:
+    """All hosts pinged in parallel (bounded by one PROBE_TIMEOUT_S); unreachable ones last."""
+    with ThreadPoolExecutor(max_workers=len(SPOT_HOSTS)) as ex:
+        rtts = dict(zip(SPOT_HOSTS, ex.map(_ping_rtt, SPOT_HOSTS)))
+    return tuple(sorted(SPOT_HOSTS, key=rtts.__getitem__))  # stable: ties keep SPOT_HOSTS order
+
+def _probe_in_background() -> None:
+    global _host_rank
+    try:
+        _host_rank = _probe_hosts()
+    except Exception:
+        pass
+
+def _host_order() -> tuple[str, ...]:
+    global _probe_started
+    rank = _host_rank
+    if rank is not None:
+        return rank
+    with _probe_lock:
+        if not _probe_started:
+            _probe_started = True
+            threading.Thread(target=_probe_in_background, name="binance-host-probe", daemon=True).start()
+    return SPOT_HOSTS
+
+def _demote_host(host: str) -> None:
+    global _host_rank
+    with _probe_lock:
+        order = [h for h in (_host_rank or SPOT_HOSTS) if h != host]
+        order.append(host)
+        _host_rank = tuple(order)
+
+def fastest_endpoint() -> str:
+    """/api/v3/time on the currently preferred Spot host (see _host_order)."""
+    return _host_order()[0] + "/api/v3/time"
+
+# In-process copy of time_offset.json: (offset_ms, recv_window_ms, file mtime_ns).
+# Replaced as a whole tuple (atomic under the GIL); re-read only when the file changes.
+_cached_offset: Optional[tuple[int, int, int]] = None
+
 def _save_offset(offset_ms: int, recv_window_ms: int = DEFAULT_RECV_WINDOW_MS):
+    global _cached_offset
     os.makedirs(RUNTIME_DIR, exist_ok=True)
     with open(OFFSET_FILE, "w", encoding="utf-8") as f:
-        json.dump({"offset_ms": int(offset_ms), "recv_window_ms": int(recv_window_ms), "ts": int(time.time()*1000)}, f)
+        json.dump({"offset_ms": int(offset_ms), "recv_window_ms": int(recv_window_ms), "ts": time.time_ns() // 1_000_000}, f)
+    try:
+        _cached_offset = (int(offset_ms), int(recv_window_ms), os.stat(OFFSET_FILE).st_mtime_ns)
+    except OSError:
+        _cached_offset = None
 
 def _load_offset() -> tuple[int, int]:
+    global _cached_offset
+    try:
+        mtime_ns = os.stat(OFFSET_FILE).st_mtime_ns
+    except OSError:
+        return 0, DEFAULT_RECV_WINDOW_MS
+    cached = _cached_offset
+    if cached is not None and cached[2] == mtime_ns:
+        return cached[0], cached[1]
     try:
         with open(OFFSET_FILE, "r", encoding="utf-8") as f:
             j = json.load(f)
-            return int(j.get("offset_ms", 0)), int(j.get("recv_window_ms", DEFAULT_RECV_WINDOW_MS))
+        off, rw = int(j.get("offset_ms", 0)), int(j.get("recv_window_ms", DEFAULT_RECV_WINDOW_MS))
     except Exception:
         return 0, DEFAULT_RECV_WINDOW_MS
+    _cached_offset = (off, rw, mtime_ns)
+    return off, rw
 
-def server_time(endpoint: str = "https://api.binance.com/api/v3/time") -> int:
-    """Return server time in ms. (Spot API: /api/v3/time)"""
-    r = _session.get(endpoint, timeout=5)
+def _fetch_time(url: str) -> tuple[int, int, int]:
+    """(server_ms, local wall ns before the request, RTT ns) for one /api/v3/time call."""
+    # wall clock sampled once; RTT measured on the monotonic clock (immune to
+    # wall-clock jumps during the request), all in integer ns
+    wall_before_ns = time.time_ns()
+    mono_before_ns = time.monotonic_ns()
+    r = _session.get(url, timeout=5)
     r.raise_for_status()
-    j = r.json()
-    return int(j["serverTime"])
+    t_server = int(r.json()["serverTime"])
+    return t_server, wall_before_ns, time.monotonic_ns() - mono_before_ns
+
+def _query_time(endpoint: Optional[str] = None) -> tuple[int, int, int]:
+    if endpoint:
+        return _fetch_time(endpoint)
+    last_exc: Optional[Exception] = None
+    for host in _host_order():
+        try:
+            return _fetch_time(host + "/api/v3/time")
+        except Exception as e:
+            last_exc = e
+            _demote_host(host)  # next sync starts from the next mirror
+    raise last_exc if last_exc is not None else RuntimeError("no Binance Spot hosts")
+
+def server_time(endpoint: Optional[str] = None) -> int:
+    """Return server time in ms. (Spot API: /api/v3/time; default: preferred host, failover to the rest)"""
+    return _query_time(endpoint)[0]
 
-def sync_time(endpoint: str = "https://api.binance.com/api/v3/time") -> TimeStatus:
+def sync_time(endpoint: Optional[str] = None) -> TimeStatus:
     """Sync local clock with Binance server time and persist offset in runtime/time_offset.json"""
+    global _last_sync_mono
     with _lock:
-        t_local_before = int(time.time()*1000)
-        t_server = server_time(endpoint)
-        t_local_after = int(time.time()*1000)
+        # RTT of the successful request only (failed mirrors don't skew the midpoint)
+        t_server, wall_before_ns, rtt_ns = _query_time(endpoint)
         # Approximate RTT midpoint correction
-        midpoint = (t_local_before + t_local_after)//2
+        midpoint = (wall_before_ns + rtt_ns // 2) // 1_000_000
         offset = int(t_server - midpoint)  # positive => server ahead of local
         _save_offset(offset, DEFAULT_RECV_WINDOW_MS)
+        _last_sync_mono = time.monotonic()
         return TimeStatus(local_ts=midpoint, server_ts=t_server, offset_ms=offset, recv_window_ms=DEFAULT_RECV_WINDOW_MS)
 
+# --- background sync -------------------------------------------------------
+# Keeps the offset fresh off the order path: callers use ensure_synced(), which
+# only blocks on a network round-trip when the last sync is older than max_age_s.
+WORKER_MIN_INTERVAL_S = 5.0
+WORKER_MAX_INTERVAL_S = 300.0
+
+_last_sync_mono: Optional[float] = None
+_worker: Optional[threading.Thread] = None
+_worker_stop = threading.Event()
+_worker_lock = threading.Lock()
+
+def ensure_synced(max_age_s: float = 60.0) -> TimeStatus:
+    """Sync only if the in-process offset is older than max_age_s; else return it."""
+    last = _last_sync_mono
+    if last is not None and time.monotonic() - last < max_age_s:
+        return current_offset()
+    return sync_time()
+
+def _worker_loop(interval_s: float) -> None:
+    interval = float(interval_s)
+    # a fresh sync (ensure_synced right before start) is not repeated: wait out its age first
+    last = _last_sync_mono
+    if last is not None:
+        age = time.monotonic() - last
+        if age < interval and _worker_stop.wait(interval - age):
+            return
+    while not _worker_stop.is_set():
+        try:
+            st = sync_time()
+            # drift too large -> check more often; stable -> back off
+            if abs(st.offset_ms) > MAX_ALLOWED_DRIFT_MS:
+                interval = max(WORKER_MIN_INTERVAL_S, interval / 2)
+            else:
+                interval = min(WORKER_MAX_INTERVAL_S, interval * 1.2)
+        except Exception:
+            interval = max(WORKER_MIN_INTERVAL_S, min(interval, float(interval_s)))
+        _worker_stop.wait(interval)
+
+def start_time_sync_worker(interval_s: float = 60.0) -> threading.Thread:
+    """Start (once) a daemon thread re-syncing with adaptive cadence."""
+    global _worker
+    with _worker_lock:
+        if _worker is None or not _worker.is_alive():
+            _worker_stop.clear()
+            _worker = threading.Thread(
+                target=_worker_loop, args=(interval_s,), name="binance-time-sync", daemon=True
+            )
+            _worker.start()
+        return _worker
+
+def stop_time_sync_worker(timeout: Optional[float] = None) -> None:
+    _worker_stop.set()
+    w = _worker
+    if w is not None:
+        w.join(timeout)
+
 def current_offset() -> TimeStatus:
     off, rw = _load_offset()
-    return TimeStatus(local_ts=int(time.time()*1000), server_ts=0, offset_ms=off, recv_window_ms=rw)
+    return TimeStatus(local_ts=time.time_ns() // 1_000_000, server_ts=0, offset_ms=off, recv_window_ms=rw)
 
 def signed_params_with_ts(params: dict | None = None) -> dict:
     """
@@ -73,7 +235,7 @@ def signed_params_with_ts(params: dict | None = None) -> dict:
     """
     params = dict(params or {})
     off, rw = _load_offset()
-    params["timestamp"] = int(time.time()*1000) + int(off)
+    params["timestamp"] = time.time_ns() // 1_000_000 + int(off)
     params["recvWindow"] = int(rw)
     return params
 
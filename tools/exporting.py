@@ -3,6 +3,11 @@ import os, csv, json, datetime as _dt
 from typing import List, Dict, Any, Optional
 from tools.formatting import fmt_pnl, fmt_price
 
+try:
+    import orjson  # optional: fast indented export, emits UTF-8 bytes
+except ImportError:
+    orjson = None
+
 EXPORT_DIR_DEFAULT = "exports"
 
 def _ensure_dir(path: str) -> None:
@@ -12,18 +17,20 @@ def _timestamp() -> str:
     return _dt.datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
 
 def normalize_row(row: Dict[str, Any]) -> Dict[str, Any]:
+    # inline `or` chains over a bound .get: faster in CPython than a table-driven loop
+    get = row.get
     return {
-        "time": row.get("time") or row.get("Time") or row.get("ts") or "",
-        "symbol": row.get("symbol") or row.get("Symbol") or "",
-        "tier": row.get("tier") or row.get("Tier"),
-        "action": row.get("action") or row.get("Action") or "CLOSE",
-        "tp": row.get("tp") or row.get("TP"),
-        "sl": row.get("sl") or row.get("SL"),
-        "pnl_pct": row.get("pnl_pct") or row.get("PnL%") or row.get("pnl_percent"),
-        "pnl_abs": row.get("pnl_abs") or row.get("PnL$") or row.get("pnl_abs_usd"),
-        "qty": row.get("qty") or row.get("Qty"),
-        "entry": row.get("entry") or row.get("Entry") or row.get("entry_price"),
-        "exit": row.get("exit") or row.get("Exit") or row.get("exit_price"),
+        "time": get("time") or get("Time") or get("ts") or "",
+        "symbol": get("symbol") or get("Symbol") or "",
+        "tier": get("tier") or get("Tier"),
+        "action": get("action") or get("Action") or "CLOSE",
+        "tp": get("tp") or get("TP"),
+        "sl": get("sl") or get("SL"),
+        "pnl_pct": get("pnl_pct") or get("PnL%") or get("pnl_percent"),
+        "pnl_abs": get("pnl_abs") or get("PnL$") or get("pnl_abs_usd"),
+        "qty": get("qty") or get("Qty"),
+        "entry": get("entry") or get("Entry") or get("entry_price"),
+        "exit": get("exit") or get("Exit") or get("exit_price"),
     }
 
 def _format_for_csv(nr: Dict[str, Any]) -> Dict[str, Any]:
@@ -46,6 +53,19 @@ def _format_for_csv(nr: Dict[str, Any]) -> Dict[str, Any]:
                 pass
     return out
 
+def _write_json(path: str, data: Any) -> None:
+    """Indented UTF-8 JSON in a single write (orjson if available)."""
+    buf = None
+    if orjson is not None:
+        try:
+            buf = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        except TypeError:
+            buf = None  # unsupported type for orjson -> stdlib
+    if buf is None:
+        buf = json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+    with open(path, "wb") as jf:
+        jf.write(buf)
+
 def export_deals_rows(
     rows: List[Dict[str, Any]],
     out_dir: str = EXPORT_DIR_DEFAULT,
@@ -75,26 +95,25 @@ def export_deals_rows(
         xlsx_path = base + ".xlsx"
 
     normalized = [normalize_row(r) for r in rows]
-    with open(json_path, "w", encoding="utf-8") as jf:
-        json.dump(normalized, jf, ensure_ascii=False, indent=2)
+    _write_json(json_path, normalized)
 
     formatted = [_format_for_csv(n) for n in normalized]
     fieldnames = ["time", "symbol", "tier", "action", "tp", "sl",
                   "pnl_pct", "pnl_abs", "qty", "entry", "exit"]
     with open(csv_path, "w", encoding="utf-8", newline="") as cf:
-        w = csv.DictWriter(cf, fieldnames=fieldnames)
-        w.writeheader()
-        for r in formatted:
-            w.writerow({k: r.get(k, "") for k in fieldnames})
+        w = csv.writer(cf)
+        w.writerow(fieldnames)
+        # plain tuples in fieldnames order, consumed by writerows in one C loop
+        w.writerows(tuple(r.get(k, "") for k in fieldnames) for r in formatted)
 
     # optional XLSX export (requires openpyxl)
     xlsx_written = ""
     try:
         import openpyxl  # type: ignore
 
-        wb = openpyxl.Workbook()
-        ws = wb.active
-        ws.title = "Deals"
+        # write-only: rows are serialized on append instead of kept as Cell objects
+        wb = openpyxl.Workbook(write_only=True)
+        ws = wb.create_sheet("Deals")
         ws.append(fieldnames)
         for r in formatted:
             ws.append([r.get(k, "") for k in fieldnames])
@@ -149,8 +168,7 @@ def export_sim_journal_entries(
             }
         )
 
-    with open(json_path, "w", encoding="utf-8") as jf:
-        json.dump(normalized, jf, ensure_ascii=False, indent=2)
+    _write_json(json_path, normalized)
 
     fieldnames = [
         "ts_utc",
@@ -162,17 +180,22 @@ def export_sim_journal_entries(
         "hypothesis",
         "signals",
     ]
+    def _csv_signals(v: Any) -> Any:
+        # keep signals compact in CSV
+        if isinstance(v, (dict, list)):
+            try:
+                return json.dumps(v, ensure_ascii=False)
+            except Exception:
+                return str(v)
+        return v
+
     with open(csv_path, "w", encoding="utf-8", newline="") as cf:
-        w = csv.DictWriter(cf, fieldnames=fieldnames)
-        w.writeheader()
-        for r in normalized:
-            row = {k: r.get(k, "") for k in fieldnames}
-            # keep signals compact in CSV
-            if isinstance(row.get("signals"), (dict, list)):
-                try:
-                    row["signals"] = json.dumps(row["signals"], ensure_ascii=False)
-                except Exception:
-                    row["signals"] = str(row["signals"])
-            w.writerow(row)
+        w = csv.writer(cf)
+        w.writerow(fieldnames)
+        w.writerows(
+            # "signals" is the last column
+            tuple(r.get(k, "") for k in fieldnames[:-1]) + (_csv_signals(r.get("signals", "")),)
+            for r in normalized
+        )
 
     return {"csv": csv_path, "json": json_path}
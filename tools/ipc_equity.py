@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+import atexit
 import csv
+import os
+import threading
 import time
 from pathlib import Path
-from typing import Optional, Any
+from typing import Optional, Any, TextIO
 
 
 # runtime/equity_history.csv (append-only)
@@ -21,32 +24,103 @@ def _safe_float(x: Any, default: float = 0.0) -> float:
         return default
 
 
+# Cached append handle + csv.writer (one open per process, header written once).
+# If the file is deleted/rotated by another process, the handle would keep writing
+# into the unlinked inode: at most every _EQ_CHECK_S it is compared with the path
+# (st_dev/st_ino) and reopened, so a fresh file gets its header again.
+# Windows: the open handle blocks deletion/rotation until this process exits.
+_EQ_CHECK_S = 1.0
+_eq_fh: Optional[TextIO] = None
+_eq_writer: Any = None
+_eq_checked = 0.0
+_eq_lock = threading.Lock()
+
+
+def _close_locked() -> None:
+    # caller holds _eq_lock
+    global _eq_fh, _eq_writer
+    if _eq_fh is not None:
+        try:
+            _eq_fh.close()  # flushes pending rows
+        except Exception:
+            pass
+    _eq_fh = None
+    _eq_writer = None
+
+
+def _is_stale(fh: TextIO) -> bool:
+    try:
+        st = EQUITY_HISTORY_FILE.stat()
+    except FileNotFoundError:
+        return True
+    fst = os.fstat(fh.fileno())
+    return (st.st_dev, st.st_ino) != (fst.st_dev, fst.st_ino)
+
+
+def _get_writer() -> Any:
+    # caller holds _eq_lock
+    global _eq_fh, _eq_writer, _eq_checked
+    if _eq_fh is not None and not _eq_fh.closed:
+        now = time.monotonic()
+        if now - _eq_checked < _EQ_CHECK_S:
+            return _eq_writer
+        _eq_checked = now
+        if not _is_stale(_eq_fh):
+            return _eq_writer
+        _close_locked()
+    RUNTIME_DIR.mkdir(parents=True, exist_ok=True)
+    try:
+        is_empty = EQUITY_HISTORY_FILE.stat().st_size == 0
+    except OSError:
+        is_empty = True
+    _eq_fh = EQUITY_HISTORY_FILE.open("a", newline="", encoding="utf-8", buffering=8192)
+    _eq_writer = csv.writer(_eq_fh)
+    if is_empty:
+        _eq_writer.writerow(["ts", "equity", "mode", "source"])
+    _eq_checked = time.monotonic()
+    return _eq_writer
+
+
 def append_equity_point(
     *,
     ts: Optional[float] = None,
     equity: Any = None,
     mode: str = "SIM",
     source: str = "UI",
+    flush: bool = True,
 ) -> None:
     """
     Append one row into runtime/equity_history.csv.
 
     Columns: ts, equity, mode, source
+    flush=True (default) makes the row visible to other readers immediately;
+    bursts may pass flush=False and call flush_equity() once.
     """
-    RUNTIME_DIR.mkdir(parents=True, exist_ok=True)
-
     _ts = float(ts) if ts is not None else time.time()
     _equity = _safe_float(equity, default=0.0)
     _mode = (mode or "SIM").upper()
     _source = str(source or "UI")
 
-    file_exists = EQUITY_HISTORY_FILE.exists()
+    # csv.writer is kept (not a raw f-string): source is free text and may need quoting
+    with _eq_lock:
+        _get_writer().writerow([f"{_ts:.3f}", f"{_equity:.8f}", _mode, _source])
+        if flush:
+            _eq_fh.flush()
+
+
+def flush_equity() -> None:
+    with _eq_lock:
+        if _eq_fh is not None and not _eq_fh.closed:
+            _eq_fh.flush()
+
+
+def _close_equity() -> None:
+    with _eq_lock:
+        _close_locked()
+
+
+atexit.register(_close_equity)
 
-    with EQUITY_HISTORY_FILE.open("a", newline="", encoding="utf-8") as f:
-        w = csv.writer(f)
-        if not file_exists:
-            w.writerow(["ts", "equity", "mode", "source"])
-        w.writerow([f"{_ts:.3f}", f"{_equity:.8f}", _mode, _source])
 
 def read_equity_history(*, max_points: Optional[int] = None) -> list[tuple[float, float]]:
     """Read runtime/equity_history.csv in a read-only manner.
@@ -55,8 +129,12 @@ def read_equity_history(*, max_points: Optional[int] = None) -> list[tuple[float
     - If file is missing or invalid -> []
     - If max_points is set -> keep only last N points
     """
+    flush_equity()  # rows buffered by this process must be visible to the read
     try:
         if not EQUITY_HISTORY_FILE.exists():
+            # removed externally: drop the handle to the unlinked file as well
+            with _eq_lock:
+                _close_locked()
             return []
     except Exception:
         return []
@@ -1,39 +1,142 @@
 
 from __future__ import annotations
-import os, json, io
-from typing import Tuple, List, Dict, Any
+import os, json, io, atexit, threading, time
+from typing import Tuple, List, Dict, Any, Optional, BinaryIO
+
+try:
+    import orjson  # optional: C encoder/decoder working on bytes
+except ImportError:
+    orjson = None
 
 RUNTIME_DIR = "runtime"
 STREAM_FILE = os.path.join(RUNTIME_DIR, "deals_stream.jsonl")
 
+_ensured = False
+
 def _ensure():
+    # once per process; read_from drops the flag if the file disappears later
+    global _ensured
+    if _ensured:
+        return
     os.makedirs(RUNTIME_DIR, exist_ok=True)
     if not os.path.exists(STREAM_FILE):
         with open(STREAM_FILE, "w", encoding="utf-8") as f:
             pass
+    _ensured = True
+
+def _dumps_line(row: Dict[str, Any]) -> bytes:
+    if orjson is not None:
+        try:
+            return orjson.dumps(row, option=orjson.OPT_APPEND_NEWLINE)
+        except TypeError:
+            pass  # e.g. non-str keys / unsupported types -> stdlib
+    return (json.dumps(row, ensure_ascii=False) + "\n").encode("utf-8")
+
+# Persistent append handle (one open per process instead of open/stat/close per row).
+# If another process deletes/rotates STREAM_FILE (e.g. clean_workspace --runtime-logs),
+# the handle would keep writing into the unlinked inode: at most every
+# _FH_CHECK_S the handle is compared with the path (st_dev/st_ino) and reopened.
+# Windows: an open handle blocks deletion/rotation of the file by other processes
+# (PermissionError there) until this process closes it — reset_stream() or exit.
+_FH_CHECK_S = 1.0
+_fh: Optional[BinaryIO] = None
+_fh_checked = 0.0
+_fh_lock = threading.Lock()
 
-def append_jsonl(row: Dict[str, Any]) -> None:
+def _fh_is_stale(fh: BinaryIO) -> bool:
+    try:
+        st = os.stat(STREAM_FILE)
+    except FileNotFoundError:
+        return True
+    fst = os.fstat(fh.fileno())
+    return (st.st_dev, st.st_ino) != (fst.st_dev, fst.st_ino)
+
+def _get_fh() -> BinaryIO:
+    # caller holds _fh_lock
+    global _fh, _fh_checked, _ensured
+    if _fh is not None and not _fh.closed:
+        now = time.monotonic()
+        if now - _fh_checked < _FH_CHECK_S:
+            return _fh
+        _fh_checked = now
+        if not _fh_is_stale(_fh):
+            return _fh
+        _close_locked()
+        _ensured = False  # path is gone or replaced: recreate dir/file as needed
     _ensure()
-    with open(STREAM_FILE, "a", encoding="utf-8") as f:
-        f.write(json.dumps(row, ensure_ascii=False) + "\n")
+    _fh = open(STREAM_FILE, "ab", buffering=1 << 16)
+    _fh_checked = time.monotonic()
+    return _fh
+
+def append_jsonl(row: Dict[str, Any], flush: bool = True) -> None:
+    """
+    Append one row. flush=True (default) keeps the row immediately visible to
+    readers in other processes; bursts may pass flush=False and call
+    flush_stream() once at the end.
+    """
+    line = _dumps_line(row)
+    with _fh_lock:
+        f = _get_fh()
+        f.write(line)
+        if flush:
+            f.flush()
+
+def flush_stream() -> None:
+    with _fh_lock:
+        if _fh is not None and not _fh.closed:
+            _fh.flush()
+
+def _close_locked() -> None:
+    # caller holds _fh_lock
+    global _fh
+    if _fh is not None:
+        try:
+            _fh.close()  # flushes pending rows
+        except Exception:
+            pass
+        _fh = None
+
+def _close_stream() -> None:
+    with _fh_lock:
+        _close_locked()
+
+atexit.register(_close_stream)
 
 def read_from(offset: int = 0) -> Tuple[List[Dict[str, Any]], int]:
+    global _ensured
     _ensure()
+    flush_stream()  # rows buffered by this process must be visible to the read
     rows: List[Dict[str, Any]] = []
-    with open(STREAM_FILE, "r", encoding="utf-8") as f:
-        f.seek(offset)
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                rows.append(json.loads(line))
-            except Exception:
-                continue
-        new_off = f.tell()
+    loads = orjson.loads if orjson is not None else json.loads
+    # one bulk read from offset, split in C; bytes go to the decoder undecoded
+    try:
+        with open(STREAM_FILE, "rb") as f:
+            f.seek(offset)
+            data = f.read()
+    except FileNotFoundError:
+        # removed externally: drop our handle to the unlinked inode too, so the
+        # next append recreates the file instead of writing into the void
+        with _fh_lock:
+            _close_locked()
+        _ensured = False
+        return rows, offset
+    # a trailing line without "\n" may still be mid-write: leave it for next call
+    end = data.rfind(b"\n") + 1
+    new_off = offset + end
+    for line in data[:end].splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            rows.append(loads(line))
+        except Exception:
+            continue
     return rows, new_off
 
 def reset_stream() -> None:
-    os.makedirs(RUNTIME_DIR, exist_ok=True)
-    with open(STREAM_FILE, "w", encoding="utf-8") as f:
-        pass
+    # under the lock: no append can reopen the handle between close and truncate
+    with _fh_lock:
+        _close_locked()
+        os.makedirs(RUNTIME_DIR, exist_ok=True)
+        with open(STREAM_FILE, "w", encoding="utf-8") as f:
+            pass
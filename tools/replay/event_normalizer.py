@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-from dataclasses import replace
 from typing import Optional
 
 from tools.replay.replay_types import TimelineEvent
@@ -21,21 +20,32 @@ class EventNormalizer:
     """
 
     def normalize(self, event: TimelineEvent) -> TimelineEvent:
+        # Fast path: already well-typed (the common case for reader output) ->
+        # skip the coercions. The payload is still copied: TimelineEvent is frozen,
+        # but its dict is not, and normalized events must not share it with the input.
+        if (
+            type(event.ts) is float
+            and type(event.seq) is int
+            and type(event.type) is str
+            and type(event.source) is str
+            and type(event.payload) is dict
+        ):
+            return TimelineEvent(
+                ts=event.ts,
+                type=event.type,
+                payload=dict(event.payload),
+                source=event.source,
+                seq=event.seq,
+            )
+
         ts = self._safe_float(event.ts, default=0.0)
         seq = int(event.seq) if event.seq is not None else 0
         etype = str(event.type) if event.type is not None else "UNKNOWN"
         source = str(event.source) if event.source is not None else "unknown"
         payload = dict(event.payload or {})
 
-        # Keep immutability + stable shape
-        return replace(
-            event,
-            ts=ts,
-            seq=seq,
-            type=etype,
-            source=source,
-            payload=payload,
-        )
+        # Keep immutability + stable shape (direct constructor: all fields are rebuilt)
+        return TimelineEvent(ts=ts, type=etype, payload=payload, source=source, seq=seq)
 
     @staticmethod
     def _safe_float(v: object, *, default: float) -> float:
@@ -20,17 +20,26 @@ class IncidentExtractor:
     def extract(self, events: List[TimelineEvent]) -> List[Incident]:
         out: List[Incident] = []
         seq = 0
+        # incidents share one source and get increasing seq, so the output is
+        # already in (ts, source, seq) order unless some ts goes backwards
+        in_order = True
+        last_ts = float("-inf")
 
         for e in (events or []):
+            # per-event coercions done once; source/seq only when an incident is emitted
+            ts_f = float(e.ts)
+            etype = str(e.type)
+            seq_before = seq
+
             # Rule 1: missing / zero timestamp
-            if float(e.ts) == 0.0:
+            if ts_f == 0.0:
                 out.append(
                     Incident(
                         level=IncidentLevel.WARNING,
                         code="REPLAY_TS_ZERO",
-                        ts=float(e.ts),
+                        ts=ts_f,
                         message="Event has zero/unknown timestamp.",
-                        context={"event_type": str(e.type), "source": str(e.source), "event_seq": int(e.seq)},
+                        context={"event_type": etype, "source": str(e.source), "event_seq": int(e.seq)},
                         source="incident_extractor:v1",
                         seq=seq,
                     )
@@ -38,12 +47,12 @@ class IncidentExtractor:
                 seq += 1
 
             # Rule 2: unknown event type
-            if str(e.type).strip() in ("", "UNKNOWN"):
+            if etype.strip() in ("", "UNKNOWN"):
                 out.append(
                     Incident(
                         level=IncidentLevel.WARNING,
                         code="REPLAY_EVENT_TYPE_UNKNOWN",
-                        ts=float(e.ts),
+                        ts=ts_f,
                         message="Event type is unknown/empty.",
                         context={"source": str(e.source), "event_seq": int(e.seq)},
                         source="incident_extractor:v1",
@@ -53,15 +62,15 @@ class IncidentExtractor:
                 seq += 1
 
             # Rule 3: malformed signal record shape (very conservative)
-            if str(e.type) == "SIGNAL_RECORD":
-                payload = dict(e.payload or {})
+            if etype == "SIGNAL_RECORD":
+                payload = e.payload  # read-only check: no copy needed
                 # Expect dict with at least 'ts' (best-effort) and something identifying the signal
                 if not isinstance(payload, dict) or len(payload) == 0:
                     out.append(
                         Incident(
                             level=IncidentLevel.RISK,
                             code="SIGNAL_RECORD_EMPTY",
-                            ts=float(e.ts),
+                            ts=ts_f,
                             message="Signal record payload is empty or invalid.",
                             context={"source": str(e.source), "event_seq": int(e.seq)},
                             source="incident_extractor:v1",
@@ -70,8 +79,16 @@ class IncidentExtractor:
                     )
                     seq += 1
 
-        # Deterministic ordering (same as replay)
-        return sorted(out, key=lambda i: (float(i.ts), str(i.source), int(i.seq)))
+            if seq != seq_before:
+                if ts_f < last_ts:
+                    in_order = False
+                last_ts = ts_f
+
+        # Deterministic ordering (same as replay). Fields are already typed
+        # (ts_f float, constant source str, seq int): no re-coercion in the key.
+        if not in_order:
+            out.sort(key=lambda i: (i.ts, i.source, i.seq))
+        return out
 
     @staticmethod
     def to_dict_list(incidents: List[Incident]) -> List[Dict[str, Any]]:
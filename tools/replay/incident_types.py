@@ -4,6 +4,8 @@ from dataclasses import dataclass
 from enum import Enum
 from typing import Any, Dict
 
+from tools.replay.replay_types import SLOTS
+
 
 class IncidentLevel(str, Enum):
     INFO = "INFO"
@@ -12,7 +14,7 @@ class IncidentLevel(str, Enum):
     PANIC = "PANIC"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **SLOTS)
 class Incident:
     """
     Read-only incident fact.
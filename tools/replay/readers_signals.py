@@ -4,6 +4,11 @@ import json
 from pathlib import Path
 from typing import List, Dict, Any
 
+try:
+    import orjson  # optional: faster per-line decode, accepts bytes
+except ImportError:
+    orjson = None
+
 from tools.replay.replay_types import TimelineEvent
 
 
@@ -24,42 +29,49 @@ def read_signals_jsonl(root_dir: str, *, strict_json: bool = False, max_events:
 
     out: List[TimelineEvent] = []
     seq = 0
+    loads = orjson.loads if orjson is not None else json.loads
+
+    limit = int(max_events) if max_events is not None else None
+
+    # one bulk read in bytes mode; lines are split in C and go to the decoder
+    # without a UTF-8 decode pass
+    with path.open("rb") as f:
+        data = f.read()
+
+    for line in data.splitlines():
+        if limit is not None and len(out) >= limit:
+            break
+
+        s = line.strip()
+        if not s:
+            continue
+
+        try:
+            rec = loads(s)
+        except Exception:
+            if strict_json:
+                raise
+            continue
+
+        if not isinstance(rec, dict):
+            continue
+
+        # best-effort timestamp extraction
+        ts = rec.get("ts")
+        try:
+            ts_f = float(ts) if ts is not None else 0.0
+        except Exception:
+            ts_f = 0.0
 
-    with path.open("r", encoding="utf-8") as f:
-        for line in f:
-            if max_events is not None and len(out) >= int(max_events):
-                break
-
-            s = (line or "").strip()
-            if not s:
-                continue
-
-            try:
-                rec = json.loads(s)
-            except Exception:
-                if strict_json:
-                    raise
-                continue
-
-            if not isinstance(rec, dict):
-                continue
-
-            # best-effort timestamp extraction
-            ts = rec.get("ts")
-            try:
-                ts_f = float(ts) if ts is not None else 0.0
-            except Exception:
-                ts_f = 0.0
-
-            out.append(
-                TimelineEvent(
-                    ts=ts_f,
-                    type="SIGNAL_RECORD",
-                    payload=rec,
-                    source="runtime/signals.jsonl",
-                    seq=seq,
-                )
+        out.append(
+            TimelineEvent(
+                ts=ts_f,
+                type="SIGNAL_RECORD",
+                payload=rec,
+                source="runtime/signals.jsonl",
+                seq=seq,
             )
-            seq += 1
+        )
+        seq += 1
 
     return out
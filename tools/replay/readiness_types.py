@@ -4,6 +4,8 @@ from dataclasses import dataclass
 from enum import Enum
 from typing import Any, Dict
 
+from tools.replay.replay_types import SLOTS
+
 
 class ReadinessSeverity(str, Enum):
     OK = "OK"
@@ -12,7 +14,7 @@ class ReadinessSeverity(str, Enum):
     RISK = "RISK"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **SLOTS)
 class ReadinessFinding:
     """
     A read-only diagnostic finding.
@@ -3,8 +3,10 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Any, Dict
 
+from tools.replay.replay_types import SLOTS
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, **SLOTS)
 class ReplayCheckpoint:
     """
     A read-only marker in the replay timeline.
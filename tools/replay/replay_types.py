@@ -1,10 +1,15 @@
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass
 from typing import Any, Dict, Optional
 
+# dataclass(slots=True) exists only on Python 3.10+; older interpreters get plain
+# (dict-backed) records. Explicit __slots__ is not an option: fields have defaults.
+SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, **SLOTS)
 class TimelineEvent:
     """
     A single immutable fact in time.
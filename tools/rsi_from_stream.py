@@ -3,17 +3,25 @@ import os
 from core.indicators import rsi, ema
 import matplotlib.pyplot as plt
 
+try:
+    import orjson  # optional: faster per-line decode on bytes
+except ImportError:
+    orjson = None
+
 STREAM = os.path.join("runtime", "ticks_stream.jsonl")
 
 def load_stream():
+    # one bulk read + C-level split; lines are decoded without a UTF-8 pass
+    with open(STREAM, "rb") as f:
+        lines = f.read().splitlines()
+    loads = orjson.loads if orjson is not None else json.loads
+    # plain list: core.indicators.rsi/ema take lists (an array would be converted back)
     prices = []
-    with open(STREAM, "r", encoding="utf-8") as f:
-        for line in f:
-            try:
-                obj = json.loads(line)
-                prices.append(float(obj["price"]))
-            except:
-                continue
+    for line in lines:
+        try:
+            prices.append(float(loads(line)["price"]))
+        except Exception:
+            continue
     return prices
 
 def main():
@@ -12,11 +12,14 @@ JSONL schema (UI compatible):
 from __future__ import annotations
 
 import argparse
+import array
 import json
 import sys
+import threading
 import time
+from collections import deque
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import BinaryIO, Deque, Dict, List, Optional
 
 # --- project root discovery ---
 ROOT_DIR = Path(__file__).resolve().parent.parent
@@ -27,31 +30,107 @@ RUNTIME_DIR = ROOT_DIR / "runtime"
 RUNTIME_DIR.mkdir(exist_ok=True)
 TICKS_FILE = RUNTIME_DIR / "ticks_stream.jsonl"
 
-from core.feeds.binance_book_ws import BinanceBookTickerThread
+# batched writer: one handle per process, lines go out in batches
+BATCH_LINES = 16
+BATCH_MAX_S = 0.1
+QUEUE_MAX = 4096  # при зависшем диске теряем самые старые тики, а не память
+
+_FH: Optional[BinaryIO] = None
+_io_lock = threading.Lock()
+
+# WS-поток только кладёт готовую строку (deque.append атомарен под GIL),
+# диск трогает отдельный writer-поток — задержки записи не тормозят WS
+_queue: Deque[bytes] = deque(maxlen=QUEUE_MAX)
+_wake = threading.Event()
+_stop = threading.Event()
+_writer: Optional[threading.Thread] = None
+
+# фиксированная схема -> шаблон вместо json.dumps (тот же вывод, что и json.dumps:
+# разделители ", " / ": ", числа через repr)
+_TICK_FMT = '{{"symbol": "{s}", "price": {p!r}, "bid": {b!r}, "ask": {a!r}, "ts": {t}}}\n'
 
 
 def _now_ms() -> int:
     return int(time.time() * 1000)
 
 
-def _q(x: float) -> float:
+def _write_tick(symbol: str, bid: float, ask: float) -> None:
     # Remove float noise without "market logic" assumptions
-    return float(round(float(x), 8))
+    # (round(float, 8) уже float; bid/ask приходят float из on_book)
+    b = round(bid, 8)
+    a = round(ask, 8)
+    price = round((b + a) / 2.0, 8) if (b > 0 and a > 0) else round(b or a or 0.0, 8)
+    sym = str(symbol).upper()
+    if sym.isalnum() and sym.isascii():
+        line = _TICK_FMT.format(s=sym, p=price, b=b, a=a, t=_now_ms()).encode("ascii")
+    else:
+        # нестандартный символ — пусть экранирует json
+        obj = {"symbol": sym, "price": price, "bid": b, "ask": a, "ts": _now_ms()}
+        line = (json.dumps(obj, ensure_ascii=False) + "\n").encode("utf-8")
+    _queue_line(line)
+
+
+def _open_ticks() -> None:
+    global _FH, _writer
+    with _io_lock:
+        if _FH is None:
+            _FH = TICKS_FILE.open("ab", buffering=1 << 16)
+    if _writer is None:
+        _stop.clear()
+        _writer = threading.Thread(target=_writer_loop, name="ticks-writer", daemon=True)
+        _writer.start()
+
+
+def _queue_line(line: bytes) -> None:
+    _queue.append(line)
+    if len(_queue) >= BATCH_LINES:
+        _wake.set()
+
+
+def _drain() -> None:
+    # UI хвостит файл: всё накопленное уходит в ОС одним write + flush
+    lines: List[bytes] = []
+    pop = _queue.popleft
+    try:
+        while True:
+            lines.append(pop())
+    except IndexError:
+        pass
+    if not lines:
+        return
+    with _io_lock:
+        if _FH is not None:
+            _FH.write(b"".join(lines))
+            _FH.flush()
+
+
+def _writer_loop() -> None:
+    # батч: BATCH_LINES строк или BATCH_MAX_S с момента прошлого слива
+    while not _stop.is_set():
+        _wake.wait(BATCH_MAX_S)
+        _wake.clear()
+        try:
+            _drain()
+        except Exception:
+            pass  # ошибка диска не должна убивать writer
 
 
-def _write_tick(symbol: str, bid: float, ask: float) -> None:
-    b = _q(bid)
-    a = _q(ask)
-    price = _q((b + a) / 2.0) if (b > 0 and a > 0) else _q(b or a or 0.0)
-    obj = {
-        "symbol": str(symbol).upper(),
-        "price": price,
-        "bid": b,
-        "ask": a,
-        "ts": _now_ms(),
-    }
-    with TICKS_FILE.open("a", encoding="utf-8") as f:
-        f.write(json.dumps(obj, ensure_ascii=False) + "\n")
+def _close_ticks() -> None:
+    global _FH, _writer
+    _stop.set()
+    _wake.set()
+    if _writer is not None:
+        _writer.join(timeout=2.0)
+        _writer = None
+    try:
+        _drain()
+    finally:
+        with _io_lock:
+            if _FH is not None:
+                try:
+                    _FH.close()
+                finally:
+                    _FH = None
 
 
 def build_args() -> argparse.Namespace:
@@ -71,46 +150,63 @@ def build_args() -> argparse.Namespace:
 
 def main() -> None:
     args = build_args()
+    # WS-стек (websocket-client, ssl, core.heartbeats) грузим после разбора аргументов:
+    # --help и ошибки аргументов не платят за импорт
+    from core.feeds.binance_book_ws import BinanceBookTickerThread
+
     symbols: List[str] = [s.strip().upper() for s in str(args.symbols).split(",") if s.strip()]
     if not symbols:
         symbols = ["ADAUSDT"]
 
     if args.reset:
         TICKS_FILE.write_text("", encoding="utf-8")
+    _open_ticks()
 
     print(f"[BOOK] writing ticks to {TICKS_FILE}")
     print(f"[BOOK] symbols={symbols}")
-    last_px: Dict[str, Tuple[float, float]] = {}
-    last_ts: Dict[str, int] = {}
+    # набор символов фиксирован на старте: состояние в параллельных массивах по индексу
+    # символы интернированы один раз; WS присылает их уже в верхнем регистре,
+    # так что .upper() нужен только на промахе
+    symbols = [sys.intern(s) for s in symbols]
+    idx: Dict[str, int] = {s: i for i, s in enumerate(symbols)}
+    # цены в целых тиках 1e-8: точное сравнение int вместо round() на каждом апдейте
+    last_bid = array.array("q", [0] * len(symbols))
+    last_ask = array.array("q", [0] * len(symbols))
+    last_ts = array.array("q", [0] * len(symbols))  # 0 = ещё не писали
     min_ms: int = int(args.min_ms)
 
 
     def on_book(symbol: str, bid: float, ask: float, bid_qty: float, ask_qty: float) -> None:
         # qty пока не пишем в jsonl — сохраняем контракт UI (price/bid/ask/ts)
-        try:
-            s = str(symbol).upper()
-            b = float(round(float(bid), 8))
-            a = float(round(float(ask), 8))
-
-            # dedup: skip exact repeats
-            prev = last_px.get(s)
-            now_ms = _now_ms()
-            prev_ts = last_ts.get(s, 0)
-
-            if prev is not None and prev[0] == b and prev[1] == a:
-                # exact same bid/ask -> skip
-                return
-
-            # throttle: don't write too frequently even if changing
-            if (now_ms - prev_ts) < min_ms:
-                return
-
-            _write_tick(s, b, a)
-            last_px[s] = (b, a)
-            last_ts[s] = now_ms
-        except Exception:
+        # без try: BinanceBookTickerThread сам ловит и логирует (throttled) ошибки колбэка,
+        # а bid/ask приходят уже float
+        i = idx.get(symbol)
+        if i is None:
+            i = idx.get(str(symbol).upper())
+            if i is None:
+                return  # не подписывались на этот символ
+        s = symbols[i]
+        bi = int(bid * 1e8 + 0.5)
+        ai = int(ask * 1e8 + 0.5)
+
+        # dedup: skip exact repeats
+        now_ms = _now_ms()
+        prev_ts = last_ts[i]
+
+        if prev_ts and last_bid[i] == bi and last_ask[i] == ai:
+            # exact same bid/ask -> skip
+            return
+
+        # throttle: don't write too frequently even if changing
+        if (now_ms - prev_ts) < min_ms:
             return
 
+        # обратно во float только для записи (bi / 1e8 — ближайший float к 8-знач. значению)
+        _write_tick(s, bi / 1e8, ai / 1e8)
+        last_bid[i] = bi
+        last_ask[i] = ai
+        last_ts[i] = now_ms
+
     t = BinanceBookTickerThread(
         symbols=symbols,
         on_book=on_book,
@@ -124,6 +220,8 @@ def main() -> None:
             time.sleep(1.0)
     except KeyboardInterrupt:
         t.stop()
+    finally:
+        _close_ticks()
 
 
 if __name__ == "__main__":
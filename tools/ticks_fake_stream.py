@@ -1,8 +1,16 @@
+import argparse
+import atexit
 import json
+import os
 import time
 import random
 from pathlib import Path
 
+try:
+    import orjson  # optional: тик сразу в UTF-8 bytes
+except ImportError:
+    orjson = None
+
 # корень проекта = два уровня выше этого файла
 ROOT_DIR = Path(__file__).resolve().parent.parent
 RUNTIME_DIR = ROOT_DIR / "runtime"
@@ -12,10 +20,31 @@ TICKS_FILE = RUNTIME_DIR / "ticks_stream.jsonl"
 
 SYMBOL = "ADAUSDT"   # можешь поменять на любой
 
+def build_args() -> argparse.Namespace:
+    p = argparse.ArgumentParser(description="Write FAKE ticks into runtime/ticks_stream.jsonl")
+    p.add_argument("--interval", type=float, default=0.5, help="Seconds between ticks. Default: 0.5")
+    p.add_argument("--verbose", action="store_true", help="Print every tick (default: ticks/s once per second)")
+    return p.parse_args()
+
 def main():
+    args = build_args()
+    interval = max(0.0, float(args.interval))
+    verbose = bool(args.verbose)
     print(f"[FAKE] writing ticks to {TICKS_FILE}")
+    # один сырой fd на весь процесс: O_APPEND + os.write без TextIOWrapper/open/close на тик
+    # (O_BINARY — чтобы Windows не переводил \n в \r\n)
+    fd = os.open(
+        str(TICKS_FILE),
+        os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, "O_BINARY", 0),
+        0o644,
+    )
+    atexit.register(os.close, fd)
     base = 100.0
     price = base
+    # без --verbose печатаем сводку раз в секунду: print на каждый тик
+    # (лок stdout + flush) упирает стресс-режим с малым --interval
+    n_ticks = 0
+    report_at = time.monotonic() + 1.0
 
     while True:
         # небольшое случайное движение
@@ -29,11 +58,23 @@ def main():
             "ts": int(time.time() * 1000),
         }
 
-        with TICKS_FILE.open("a", encoding="utf-8") as f:
-            f.write(json.dumps(obj, ensure_ascii=False) + "\n")
+        if orjson is not None:
+            line = orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+        else:
+            line = (json.dumps(obj, ensure_ascii=False) + "\n").encode("utf-8")
+        os.write(fd, line)
 
-        print("[FAKE]", obj)
-        time.sleep(0.5)  # один тик раз в полсекунды
+        n_ticks += 1
+        if verbose:
+            print("[FAKE]", obj)
+        else:
+            now = time.monotonic()
+            if now >= report_at:
+                print(f"[FAKE] {n_ticks} ticks/s, last price={obj['price']}")
+                n_ticks = 0
+                report_at = now + 1.0
+        if interval:
+            time.sleep(interval)  # по умолчанию один тик раз в полсекунды
 
 if __name__ == "__main__":
     main()
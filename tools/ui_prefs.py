@@ -1,7 +1,12 @@
 
 from __future__ import annotations
 import os, json
-from typing import Any, Dict
+from typing import Any, Dict, Optional, Tuple
+
+try:
+    import orjson  # optional: faster parse/serialize straight on bytes
+except ImportError:
+    orjson = None
 
 RUNTIME_DIR = "runtime"
 PREFS_FILE = os.path.join(RUNTIME_DIR, "ui_prefs.json")
@@ -13,26 +18,50 @@ _DEFAULTS: Dict[str, Any] = {
     "ticker_tooltip": True,
 }
 
+# (st_mtime_ns, parsed prefs): repeated loads cost one stat until the file changes
+_CACHE: Optional[Tuple[int, Dict[str, Any]]] = None
+
 def ensure_runtime():
     os.makedirs(RUNTIME_DIR, exist_ok=True)
 
 def load_prefs() -> Dict[str, Any]:
+    global _CACHE
     ensure_runtime()
-    if not os.path.exists(PREFS_FILE):
+    try:
+        mtime_ns = os.stat(PREFS_FILE).st_mtime_ns
+    except OSError:
         return dict(_DEFAULTS)
+    cached = _CACHE
+    if cached is not None and cached[0] == mtime_ns:
+        return dict(cached[1])  # copy: callers may mutate the result
     try:
-        with open(PREFS_FILE, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        out = dict(_DEFAULTS)
-        for k in _DEFAULTS:
-            out[k] = data.get(k, _DEFAULTS[k])
-        return out
+        with open(PREFS_FILE, "rb") as f:
+            raw = f.read()
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+        # only known keys, missing ones fall back to defaults
+        prefs = {k: data.get(k, v) for k, v in _DEFAULTS.items()}
     except Exception:
         return dict(_DEFAULTS)
+    _CACHE = (mtime_ns, prefs)
+    return dict(prefs)
+
+def _dumps(out: Dict[str, Any]) -> bytes:
+    if orjson is not None:
+        try:
+            return orjson.dumps(out, option=orjson.OPT_INDENT_2)
+        except TypeError:
+            pass  # unsupported type for orjson -> stdlib
+    return json.dumps(out, ensure_ascii=False, indent=2).encode("utf-8")
 
 def save_prefs(p: Dict[str, Any]) -> None:
+    global _CACHE
     ensure_runtime()
+    _CACHE = None
     out = dict(_DEFAULTS)
     out.update(p or {})
-    with open(PREFS_FILE, "w", encoding="utf-8") as f:
-        json.dump(out, f, ensure_ascii=False, indent=2)
+    buf = _dumps(out)
+    # atomic: tmp + os.replace, a crash mid-write never leaves a truncated prefs file
+    tmp = PREFS_FILE + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(buf)
+    os.replace(tmp, PREFS_FILE)
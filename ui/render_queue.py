@@ -1,7 +1,7 @@
 
 from __future__ import annotations
 import time
-from typing import Callable
+from typing import Callable, Optional
 
 class RenderQueue:
     """
@@ -9,19 +9,22 @@ class RenderQueue:
       - signal() marks a pending render
       - try_render(fn) executes at most once per min_interval
       - multiple signals within interval are coalesced into one render
+    Uses time.monotonic(): wall-clock jumps (NTP, manual changes) can't stall rendering.
     """
     def __init__(self, max_fps: int = 30):
         self.min_interval = 1.0 / max_fps if max_fps > 0 else 0.033
-        self._last = 0.0
+        self._last = float("-inf")
         self._pending = False
 
     def signal(self) -> None:
         self._pending = True
 
-    def try_render(self, render_fn: Callable[[], None]) -> None:
-        now = time.time()
+    def try_render(self, render_fn: Callable[[], None], now: Optional[float] = None) -> None:
+        # `now` lets a caller read the clock once (time.monotonic()) for several queues
         if not self._pending:
             return
+        if now is None:
+            now = time.monotonic()
         if now - self._last < self.min_interval:
             return
         self._pending = False
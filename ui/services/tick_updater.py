@@ -2,12 +2,37 @@
 from __future__ import annotations
 
 from typing import Any
+import json
 import time
 
+try:
+    import orjson  # optional: быстрый канонический дамп снапшота для fingerprint
+except ImportError:
+    orjson = None
+
+try:
+    import xxhash  # optional: xxh3 по байтам дампа; иначе встроенный hash()
+except ImportError:
+    xxhash = None
+
 from ui.events.bus import event_bus
 from ui.events.types import Event, EVT_SNAPSHOT
 
 
+def _fingerprint(snapshot: dict) -> int | None:
+    """Стабильный отпечаток содержимого снапшота (None — не удалось сериализовать)."""
+    try:
+        if orjson is not None:
+            raw = orjson.dumps(snapshot, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+        else:
+            raw = json.dumps(snapshot, sort_keys=True, default=str).encode("utf-8")
+    except Exception:
+        return None
+    if xxhash is not None:
+        return xxhash.xxh3_64_intdigest(raw)
+    return hash(raw)
+
+
 class TickUpdater:
     """Лёгкий TickService / Update Router для UI.
 
@@ -26,6 +51,7 @@ class TickUpdater:
     def __init__(self, app: Any) -> None:
         self.app = app
         self._last_version: str | int | None = None
+        self._last_fp: int | None = None  # fingerprint содержимого (снапшоты без version)
         self._last_snapshot_ts: float | None = None  # STEP1.4.1: UI heartbeat
 
     # ------------------------------------------------------------------ API --
@@ -34,19 +60,18 @@ class TickUpdater:
         """Получает снапшот ядра и раздаёт его tick-чувствительным виджетам.
 
         Сейчас реализовано только:
-        - простая дедупликация по version/state_version;
+        - простая дедупликация по version/state_version,
+          а для снапшотов без версии — по fingerprint содержимого;
         - безопасные вызовы потенциальных хендлеров, если они есть.
         """
 
         app = self.app
         snapshot = snapshot or {}
+        if not isinstance(snapshot, dict):
+            return  # подписчики всё равно принимают только dict
 
         # --- dedupe по версии снапшота, чтобы не дёргать UI без надобности
-        version = None
-        try:
-            version = snapshot.get("version") or snapshot.get("state_version")
-        except Exception:
-            version = None
+        version = snapshot.get("version") or snapshot.get("state_version")
 
         if version is not None and version == self._last_version:
             # ничего нового, можно тихо выйти
@@ -54,28 +79,39 @@ class TickUpdater:
 
         self._last_version = version
 
+        # --- без version: дедуп по содержимому (иначе каждый снапшот уходит всем подписчикам)
+        if version is None:
+            fp = _fingerprint(snapshot)
+            if fp is not None and fp == self._last_fp:
+                return
+            self._last_fp = fp
+        else:
+            self._last_fp = None
+
         # --- публикуем EVT_SNAPSHOT в EventBus (Unified Event System)
         # STEP1.4.1: добавляем heartbeat-метрику lag_s (время между снапшотами)
-        try:
-            now = time.time()
-            if self._last_snapshot_ts is None:
-                lag_s = 0.0
-            else:
-                lag_s = max(0.0, now - self._last_snapshot_ts)
-            self._last_snapshot_ts = now
-
-            event = Event(
-                type=EVT_SNAPSHOT,
-                ts=now,
-                source="TickUpdater",
-                payload={
-                    "snapshot": snapshot,
-                    "meta": {
-                        "lag_s": lag_s,
-                        "ts": now,
-                    },
+        now = time.time()
+        if self._last_snapshot_ts is None:
+            lag_s = 0.0
+        else:
+            lag_s = max(0.0, now - self._last_snapshot_ts)
+        self._last_snapshot_ts = now
+
+        # payload/meta — новые на каждый тик: подписчики (и очередь EventBus)
+        # могут держать ссылку на событие дольше publish
+        event = Event(
+            type=EVT_SNAPSHOT,
+            ts=now,
+            source="TickUpdater",
+            payload={
+                "snapshot": snapshot,
+                "meta": {
+                    "lag_s": lag_s,
+                    "ts": now,
                 },
-            )
+            },
+        )
+        try:
             event_bus.publish(event)
         except Exception:
             # проблемы в EventBus не должны ломать основной tick-пайплайн
@@ -0,0 +1,30 @@
+# ui/widgets/_njit.py
+# Optional numba JIT for UI indicator kernels.
+#
+# `njit` compiles with numba when it is installed; otherwise it is a no-op
+# decorator and callers should keep their plain-Python paths (check HAVE_NUMBA:
+# an uncompiled kernel looping over a numpy array is slower than a list loop).
+
+from __future__ import annotations
+
+from typing import Any, Callable
+
+try:
+    from numba import njit as _numba_njit
+    HAVE_NUMBA = True
+except Exception:  # pragma: no cover
+    _numba_njit = None
+    HAVE_NUMBA = False
+
+
+def njit(*args: Any, **kwargs: Any) -> Any:
+    """`@njit` / `@njit(cache=True, ...)` that degrades to identity without numba."""
+    if HAVE_NUMBA:
+        return _numba_njit(*args, **kwargs)
+    if len(args) == 1 and callable(args[0]) and not kwargs:
+        return args[0]
+
+    def _wrap(fn: Callable[..., Any]) -> Callable[..., Any]:
+        return fn
+
+    return _wrap
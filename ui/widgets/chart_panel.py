@@ -26,6 +26,37 @@ from tkinter import ttk
 
 import os
 
+try:
+    import numpy as np  # optional: vectorized indicator math
+except ImportError:
+    np = None
+
+try:
+    # optional: EMA as a first-order IIR filter in one C loop
+    from scipy.signal import lfilter as _lfilter
+except Exception:
+    _lfilter = None
+if np is None:
+    _lfilter = None
+
+from ui.widgets._njit import HAVE_NUMBA, njit
+
+if np is None:
+    HAVE_NUMBA = False
+
+# below this length list<->array conversion costs more than the Python loop
+_EMA_VEC_MIN = 300
+
+# live tick chart: at most one render per frame (~30 fps)
+_LIVE_FRAME_MS = 33
+
+# ENTRY / TP / SL overlay colors (explicit: must stay visible over candles/grid)
+_LEVEL_COLORS: Dict[str, str] = {
+    "ENTRY": "#FFFFFF",
+    "TP":    "#00D18F",
+    "SL":    "#FF4D4D",
+}
+
 # Matplotlib is optional. If missing, we will fallback to Canvas charts.
 try:
     import matplotlib
@@ -50,10 +81,90 @@ def _clamp(v: float, lo: float, hi: float) -> float:
         return lo
 
 
+def _as_f64(values: Sequence[float]) -> Any:
+    """`values` as a 1-D float64 array, or None (no numpy / non-numeric / NaN entries).
+
+    None -> nan in asarray: such input must stay on the Python loops,
+    which skip bad entries.
+    """
+    if np is None:
+        return None
+    try:
+        arr = np.asarray(values, dtype=np.float64)
+    except (TypeError, ValueError):
+        return None
+    if arr.ndim != 1 or np.isnan(arr).any():
+        return None
+    return arr
+
+
+# JIT kernels (compiled only with numba; callers check HAVE_NUMBA).
+# No fastmath: RSI relies on inf for a zero average loss, and results must
+# match the Python loops bit for bit.
+
+@njit(cache=True)
+def _ema_loop(arr, k):  # pragma: no cover - compiled
+    out = np.empty(arr.shape[0])
+    ema_prev = arr[0]
+    out[0] = ema_prev
+    for i in range(1, arr.shape[0]):
+        ema_prev = (arr[i] - ema_prev) * k + ema_prev
+        out[i] = ema_prev
+    return out
+
+
+@njit(cache=True)
+def _rsi_loop(arr, period):  # pragma: no cover - compiled
+    # out[m] corresponds to arr[period + m]; avg_gain/avg_loss are the Wilder states
+    m = arr.shape[0] - period
+    out = np.empty(m)
+    avg_gain = np.empty(m)
+    avg_loss = np.empty(m)
+    g = 0.0
+    l = 0.0
+    for i in range(1, period + 1):
+        d = arr[i] - arr[i - 1]
+        g += max(0.0, d)
+        l += max(0.0, -d)
+    ag = g / period
+    al = l / period
+    for j in range(m):
+        if j:
+            d = arr[period + j] - arr[period + j - 1]
+            ag = (ag * (period - 1) + max(0.0, d)) / period
+            al = (al * (period - 1) + max(0.0, -d)) / period
+        rs = ag / al if al > 0 else np.inf
+        out[j] = 100.0 - (100.0 / (1.0 + rs))
+        avg_gain[j] = ag
+        avg_loss[j] = al
+    return out, avg_gain, avg_loss
+
+
+def _use_f64(n: int) -> bool:
+    """Whether a series of length n goes through the array kernels."""
+    return HAVE_NUMBA or (_lfilter is not None and n >= _EMA_VEC_MIN)
+
+
+def _ema_f64(arr: Any, k: float) -> Any:
+    """EMA of a clean float64 array as an array (None: no array kernel for this length)."""
+    if HAVE_NUMBA:
+        return _ema_loop(arr, k)
+    if _lfilter is not None and arr.shape[0] >= _EMA_VEC_MIN:
+        # s_t = k*x_t + (1-k)*s_{t-1}, seeded with s_0 = x_0 (zi = (1-k)*x_0)
+        out_arr, _ = _lfilter([k], [1.0, k - 1.0], arr, zi=[arr[0] * (1.0 - k)])
+        return out_arr
+    return None
+
+
 def _ema(values: Sequence[float], period: int) -> List[float]:
-    if not values or period <= 1:
+    # len(): values may be a numpy array
+    if len(values) == 0 or period <= 1:
         return []
     k = 2.0 / (period + 1.0)
+    if _use_f64(len(values)):
+        arr = _as_f64(values)
+        if arr is not None:
+            return _ema_f64(arr, k).tolist()
     out: List[float] = []
     ema_prev: Optional[float] = None
     for v in values:
@@ -71,8 +182,12 @@ def _ema(values: Sequence[float], period: int) -> List[float]:
 
 def _rsi(values: Sequence[float], period: int = 14) -> List[float]:
     # Simple RSI (Wilder)
-    if not values or period <= 1 or len(values) < period + 1:
+    if len(values) == 0 or period <= 1 or len(values) < period + 1:
         return []
+    if HAVE_NUMBA:
+        arr = _as_f64(values)
+        if arr is not None:
+            return _rsi_loop(arr, period)[0].tolist()
     gains: List[float] = []
     losses: List[float] = []
     for i in range(1, len(values)):
@@ -98,8 +213,15 @@ def _rsi(values: Sequence[float], period: int = 14) -> List[float]:
 
 
 def _macd(values: Sequence[float], fast: int = 12, slow: int = 26, signal: int = 9) -> Tuple[List[float], List[float], List[float]]:
-    if not values:
+    if len(values) == 0:
         return ([], [], [])
+    if fast > 1 and slow > 1 and signal > 1 and _use_f64(len(values)):
+        # one float64 conversion shared by both EMAs; the lines stay arrays until the end
+        arr = _as_f64(values)
+        if arr is not None:
+            macd_arr = _ema_f64(arr, 2.0 / (fast + 1.0)) - _ema_f64(arr, 2.0 / (slow + 1.0))
+            sig_arr = _ema_f64(macd_arr, 2.0 / (signal + 1.0))
+            return (macd_arr.tolist(), sig_arr.tolist(), (macd_arr - sig_arr).tolist())
     ema_fast = _ema(values, fast)
     ema_slow = _ema(values, slow)
     n = min(len(ema_fast), len(ema_slow))
@@ -116,6 +238,149 @@ def _macd(values: Sequence[float], fast: int = 12, slow: int = 26, signal: int =
     return (macd2, sig2, hist)
 
 
+class _IncIndicators:
+    """Incremental EMA/RSI/MACD over a series that mostly changes at the tail.
+
+    Between redraws the input usually differs only in the last point (forming
+    candle), by appended points, or is a fixed-size window that slid left by
+    k points (live ticks / full candle window). Every output value at index i
+    depends only on the values before it, so cached results for the overlap
+    with the previous input are kept (dropping the k points that slid out) and
+    only the new tail is computed: O(k) per redraw instead of O(N).
+
+    Without a shift, results equal _ema/_rsi/_macd on the same input. After a
+    shift the series continue the stream seen so far (EMA/Wilder state is not
+    re-seeded at the new first point), so they differ from a recompute of the
+    window only by the decaying influence of the original seed. Returned lists
+    are owned by the cache: read-only for callers.
+    """
+
+    def __init__(self) -> None:
+        self._vals: List[float] = []
+        self._ema: Dict[int, List[float]] = {}
+        self._rsi: Dict[int, Tuple[List[float], List[Tuple[float, float]]]] = {}
+        self._macd: Dict[Tuple[int, int, int], Tuple[List[float], List[float], List[float]]] = {}
+
+    @staticmethod
+    def _overlap(prev: List[float], new: List[float]) -> Tuple[int, int]:
+        """(shift, common): prev[shift:shift+common] == new[:common], all but the
+        last point of prev[shift:] required to match; (0, 0) if unrelated.
+
+        Shifts beyond half the window are treated as a new series.
+        """
+        n_prev = len(prev)
+        if not n_prev or not new:
+            return 0, 0
+        first = new[0]
+        for k in range(n_prev // 2 + 1):
+            m = n_prev - k
+            if m > 1 and prev[k] != first:
+                continue
+            if len(new) >= m - 1 and new[: m - 1] == prev[k : n_prev - 1]:
+                cp = m if (len(new) >= m and new[m - 1] == prev[-1]) else m - 1
+                return k, min(cp, len(new))
+        return 0, 0
+
+    def update(self, values: Sequence[float]) -> None:
+        new = [float(v) for v in values]
+        shift, cp = self._overlap(self._vals, new)
+        self._vals = new
+
+        # every cached series is index-aligned with the values: drop what slid out,
+        # then the part that no longer matches
+        for out in self._ema.values():
+            del out[:shift]
+            del out[cp:]
+        for period, (out, avgs) in self._rsi.items():
+            # out[m] corresponds to values[period + m]
+            keep = max(0, cp - period)
+            del out[:shift]
+            del avgs[:shift]
+            del out[keep:]
+            del avgs[keep:]
+        for lines in self._macd.values():
+            for out in lines:
+                del out[:shift]
+                del out[cp:]
+
+    @property
+    def values(self) -> List[float]:
+        """Last input as a float list (read-only)."""
+        return self._vals
+
+    def ema(self, period: int) -> List[float]:
+        vals = self._vals
+        if not vals or period <= 1:
+            return []
+        out = self._ema.get(period)
+        if out is None:
+            out = self._ema[period] = []
+        if not out:
+            out.extend(_ema(vals, period))
+            return out
+        k = 2.0 / (period + 1.0)
+        ema_prev = out[-1]
+        for i in range(len(out), len(vals)):
+            ema_prev = (vals[i] - ema_prev) * k + ema_prev
+            out.append(ema_prev)
+        return out
+
+    def rsi(self, period: int = 14) -> List[float]:
+        vals = self._vals
+        if not vals or period <= 1 or len(vals) < period + 1:
+            return []
+        entry = self._rsi.get(period)
+        if entry is None:
+            entry = self._rsi[period] = ([], [])
+        out, avgs = entry
+        if not out and HAVE_NUMBA:
+            # full (re)computation in one compiled pass, Wilder states included
+            arr = _as_f64(vals)
+            if arr is not None:
+                o, ag, al = _rsi_loop(arr, period)
+                out.extend(o.tolist())
+                avgs.extend(zip(ag.tolist(), al.tolist()))
+                return out
+        if not out:
+            # same initial average as _rsi (sum over the first `period` diffs)
+            gains = [max(0.0, vals[i] - vals[i - 1]) for i in range(1, period + 1)]
+            losses = [max(0.0, vals[i - 1] - vals[i]) for i in range(1, period + 1)]
+            avg_gain = sum(gains) / period
+            avg_loss = sum(losses) / period
+            rs = avg_gain / avg_loss if avg_loss > 0 else math.inf
+            out.append(100.0 - (100.0 / (1.0 + rs)))
+            avgs.append((avg_gain, avg_loss))
+        avg_gain, avg_loss = avgs[-1]
+        # out[m] corresponds to vals[period + m]
+        for t in range(period + len(out), len(vals)):
+            d = vals[t] - vals[t - 1]
+            avg_gain = (avg_gain * (period - 1) + max(0.0, d)) / period
+            avg_loss = (avg_loss * (period - 1) + max(0.0, -d)) / period
+            rs = avg_gain / avg_loss if avg_loss > 0 else math.inf
+            out.append(100.0 - (100.0 / (1.0 + rs)))
+            avgs.append((avg_gain, avg_loss))
+        return out
+
+    def macd(self, fast: int = 12, slow: int = 26, signal: int = 9) -> Tuple[List[float], List[float], List[float]]:
+        ema_fast = self.ema(fast)
+        ema_slow = self.ema(slow)
+        n = min(len(ema_fast), len(ema_slow))
+        if n <= 0 or signal <= 1:
+            return _macd(self._vals, fast, slow, signal)
+        lines = self._macd.get((fast, slow, signal))
+        if lines is None:
+            lines = self._macd[(fast, slow, signal)] = ([], [], [])
+        macd, sig, hist = lines
+        k = 2.0 / (signal + 1.0)
+        for i in range(len(macd), n):
+            m = ema_fast[i] - ema_slow[i]
+            s = m if not sig else (m - sig[-1]) * k + sig[-1]
+            macd.append(m)
+            sig.append(s)
+            hist.append(m - s)
+        return lines
+
+
 # ----------------------------- canvas fallback (minimal)
 
 class CanvasChart(ttk.Frame):
@@ -125,16 +390,35 @@ class CanvasChart(ttk.Frame):
         self.canvas.pack(fill="both", expand=True)
         self._title = ""
         self._info = ""
+        self._redraw_after: Optional[str] = None
+        self._schedule_redraw()  # placeholder is painted even if no setter changes a value
+
+    def destroy(self) -> None:
+        if self._redraw_after is not None:
+            try:
+                self.after_cancel(self._redraw_after)
+            except Exception:
+                pass
+            self._redraw_after = None
+        super().destroy()
 
     def set_title(self, title: str) -> None:
-        self._title = title
-        self._redraw()
+        if title != self._title:
+            self._title = title
+            self._schedule_redraw()
 
     def set_info(self, info: str) -> None:
-        self._info = info
-        self._redraw()
+        if info != self._info:
+            self._info = info
+            self._schedule_redraw()
+
+    def _schedule_redraw(self) -> None:
+        # set_title + set_info (and every live tick) share one repaint when Tk is idle
+        if self._redraw_after is None:
+            self._redraw_after = self.after_idle(self._redraw)
 
     def _redraw(self) -> None:
+        self._redraw_after = None
         self.canvas.delete("all")
         w = max(1, int(self.canvas.winfo_width()))
         h = max(1, int(self.canvas.winfo_height()))
@@ -209,7 +493,13 @@ class ChartPanel(ttk.Frame):
             # Perf caches / draw scheduling (avoid UI freeze from draw churn)
             self._pending_draw = None   # after_idle id (prevent draw queue explosion)
             self._xtick_cache = None    # (key, xticks, xlabels)
-            self._rsi_cache = None      # (key, values)
+            # incremental indicators: only the changed tail is recomputed per redraw
+            self._ind_candles = _IncIndicators()
+            self._ind_live = _IncIndicators()
+            self._xs_cache_live = None  # x = 0..n-1, rebuilt only when n changes
+            self._live_after = None     # after() id of the pending live render
+            self._live_pending_prices = None
+            self._live_last_render = -math.inf  # monotonic time of the last live render
             self._perf_log_ts = 0.0
 
             # Data holders
@@ -268,6 +558,16 @@ class ChartPanel(ttk.Frame):
             self.canvas = FigureCanvasTkAgg(self.figure, master=self)
             self.canvas.get_tk_widget().pack(fill="both", expand=True)
 
+            # Live blitting: static background captured on every full draw (incl. resize);
+            # live frames restore it and redraw only the animated series artists
+            self._blit_live = False
+            self._blit_bg = None
+            self._blit_limits = None
+            try:
+                self.canvas.mpl_connect("draw_event", self._on_draw_event)
+            except Exception:
+                pass
+
             # Artists storage for cleanup
             self._candle_artists: list = []
 
@@ -305,6 +605,11 @@ class ChartPanel(ttk.Frame):
 
             # FAST MACD histogram: 1 PolyCollection instead of 200+ bar objects
             self._macd_hist_collection = None  # PolyCollection
+            # bar colors as RGBA once (vectorized hist builds pick rows, no per-bar parsing)
+            self._hist_rgba = (
+                matplotlib.colors.to_rgba(self.theme.hist_pos),
+                matplotlib.colors.to_rgba(self.theme.hist_neg),
+            )
 
             # MACD ylim cache (manual + throttled to avoid tick/layout churn)
             self._macd_ylim_cache = None  # type: ignore  # (lo, hi)
@@ -541,6 +846,8 @@ class ChartPanel(ttk.Frame):
                 return
             self._last_draw_ts = now
 
+            self._set_blit_live(False)
+
             # Clear old artists
             self._clear_candles_artists()
             try:
@@ -761,9 +1068,11 @@ class ChartPanel(ttk.Frame):
                         except Exception:
                             pass
 
-            # EMA overlays
-            ema20 = _ema(closes, period=20)
-            ema50 = _ema(closes, period=50)
+            # EMA overlays (incremental: forming candle -> O(1) update)
+            ind = self._ind_candles
+            ind.update(closes)
+            ema20 = ind.ema(20)
+            ema50 = ind.ema(50)
             try:
                 self._line_ema20.set_data(xs[: len(ema20)], ema20 if ema20 else [])
                 self._line_ema50.set_data(xs[: len(ema50)], ema50 if ema50 else [])
@@ -775,13 +1084,7 @@ class ChartPanel(ttk.Frame):
                 try:
                     x_right = max(0, len(xs) - 1)
 
-                    # Explicit colors + high zorder to ensure visibility over candles/grid
-                    color_map = {
-                        "ENTRY": "#FFFFFF",
-                        "TP":    "#00D18F",
-                        "SL":    "#FF4D4D",
-                    }
-
+                    # Explicit colors (_LEVEL_COLORS) + high zorder to ensure visibility over candles/grid
                     for name, val in (levels or {}).items():
                         try:
                             y = float(val)
@@ -790,7 +1093,7 @@ class ChartPanel(ttk.Frame):
                         if y <= 0:
                             continue
 
-                        c = color_map.get(str(name).upper(), "#FFFFFF")
+                        c = _LEVEL_COLORS.get(str(name).upper(), "#FFFFFF")
 
                         # Horizontal line (ensure on top)
                         try:
@@ -955,22 +1258,8 @@ class ChartPanel(ttk.Frame):
             # RSI + MACD (feature-flagged to reduce UI load)
             try:
                 if getattr(self, "_enable_rsi", True):
-                    # PERF: cache RSI when closes window unchanged
-                    try:
-                        tail = closes[-40:] if len(closes) >= 40 else closes
-                        rsi_key = (len(closes), float(tail[0]) if tail else 0.0, float(tail[-1]) if tail else 0.0, tuple(round(x, 10) for x in tail))
-                    except Exception:
-                        rsi_key = None
-
-                    cached = getattr(self, "_rsi_cache", None)
-                    if cached and len(cached) == 2 and cached[0] == rsi_key:
-                        rsi_vals = cached[1]
-                    else:
-                        rsi_vals = _rsi(closes, period=14)
-                        try:
-                            self._rsi_cache = (rsi_key, rsi_vals)
-                        except Exception:
-                            pass
+                    # PERF: unchanged closes -> cached RSI, tail change -> O(1) update
+                    rsi_vals = ind.rsi(14)
 
                     if rsi_vals:
                         xs_rsi = xs[-len(rsi_vals) :]
@@ -989,7 +1278,7 @@ class ChartPanel(ttk.Frame):
 
             try:
                 if getattr(self, "_enable_macd", True):
-                    macd_line, signal_line, hist = _macd(closes)
+                    macd_line, signal_line, hist = ind.macd()
                     if macd_line and signal_line:
                         xs_macd = xs[-len(macd_line) :]
                         self._line_macd.set_data(xs_macd, macd_line)
@@ -1017,24 +1306,7 @@ class ChartPanel(ttk.Frame):
                                     pass
                             else:
                                 # Build histogram rectangles as polygons
-                                width = 0.65
-                                verts = []
-                                colors = []
-                                for i, h in enumerate(hist):
-                                    x = xs_macd[i]
-                                    left = x - width / 2.0
-                                    right = x + width / 2.0
-                                    bottom = 0.0
-                                    top = float(h)
-
-                                    verts.append([
-                                        (left, bottom),
-                                        (right, bottom),
-                                        (right, top),
-                                        (left, top),
-                                        (left, bottom),
-                                    ])
-                                    colors.append(self.theme.hist_pos if top >= 0 else self.theme.hist_neg)
+                                verts, colors = self._hist_polys(xs_macd, hist)
 
                                 # Create/update collection
                                 if self._macd_hist_collection is None and PolyCollection is not None:
@@ -1268,9 +1540,9 @@ class ChartPanel(ttk.Frame):
 
             # Title
             try:
-                c = {"fg": self.theme.fg}
+                fg = self.theme.fg
             except Exception:
-                c = {"fg": "#ffffff"}
+                fg = "#ffffff"
 
             try:
                 title = f"MontrixBot — Candles (n={len(candles)})"
@@ -1292,7 +1564,7 @@ class ChartPanel(ttk.Frame):
                 self.figure.suptitle(
                     title,
                     fontsize=10,
-                    color=c["fg"],
+                    color=fg,
                 )
             except Exception:
                 pass
@@ -1310,6 +1582,22 @@ class ChartPanel(ttk.Frame):
                 except Exception:
                     pass
 
+        def _xs_for(self, n: int) -> Sequence[float]:
+            """Cached index x-axis 0..n-1 (ndarray with numpy; matplotlib copies on set_data)."""
+            cached = self._xs_cache_live
+            if cached is None or len(cached) != n:
+                cached = np.arange(n, dtype=np.float64) if np is not None else list(range(n))
+                self._xs_cache_live = cached
+            return cached
+
+        def plot_series(self, ts_ms: Sequence[int], prices: Sequence[float]) -> None:
+            """Live tick chart: price + RSI + MACD (ChartController RSI/LIVE windows).
+
+            Goes through _redraw_live: a burst of calls within one frame renders
+            only the latest series.
+            """
+            self._redraw_live(prices)
+
         # ----------------------------- legacy API
 
         def plot_price_series(self, ts_ms: Sequence[int], prices: Sequence[float], *, title: str = "LIVE") -> None:
@@ -1322,24 +1610,21 @@ class ChartPanel(ttk.Frame):
                     pass
                 return
 
-            # store (optionally capped)
-            self._prices = list(prices or [])
+            self._set_blit_live(False)
 
+            # store (optionally capped): one copy of the kept tail, x reused while n is stable
             try:
                 cap = int(getattr(self, "_max_ticks", 0) or 0)
             except Exception:
                 cap = 0
 
-            if cap and cap > 0 and len(self._prices) > cap:
-                self._prices = self._prices[-cap:]
-                try:
-                    ts_ms = list(ts_ms or [])
-                    if len(ts_ms) > cap:
-                        ts_ms = ts_ms[-cap:]
-                except Exception:
-                    pass
+            prices = prices or []
+            if cap and cap > 0 and len(prices) > cap:
+                self._prices = list(prices[-cap:])
+            else:
+                self._prices = list(prices)
 
-            xs = list(range(len(self._prices)))
+            xs = self._xs_for(len(self._prices))
             ys = self._prices
 
             # clear and draw
@@ -1354,8 +1639,7 @@ class ChartPanel(ttk.Frame):
                 pass
 
             self._line_price.set_data(xs, ys)
-            self.ax_price.relim()
-            self.ax_price.autoscale_view(scalex=True, scaley=True)
+            self._fit_live_price_axis(ys)
             self.ax_price.set_title(title, color=self.theme.fg, fontsize=10, loc="left")
             try:
                 self.canvas.draw_idle()
@@ -1371,6 +1655,17 @@ class ChartPanel(ttk.Frame):
                     pass
                 return
 
+            self._set_blit_live(False)
+
+            # drop a coalesced live render that would repaint the old series
+            if self._live_after is not None:
+                try:
+                    self.after_cancel(self._live_after)
+                except Exception:
+                    pass
+                self._live_after = None
+            self._live_pending_prices = None
+
             self._clear_candles_artists()
             try:
                 self._clear_level_artists()
@@ -1426,7 +1721,13 @@ class ChartPanel(ttk.Frame):
                 pass
 
         def _redraw_live(self, prices: Sequence[float]) -> None:
-            """Internal: update live price series without full reset."""
+            """Internal: update live price series without full reset.
+
+            Throttled to one render per frame (~33 ms): a call after a quiet frame
+            renders immediately (the 250-500 ms controller poll never waits); calls
+            within a frame of the last render are merged into one deferred render
+            of the latest series.
+            """
             if not self._use_mpl:
                 try:
                     self.fallback.set_title("LIVE")
@@ -1435,12 +1736,40 @@ class ChartPanel(ttk.Frame):
                     pass
                 return
 
-            self._prices = list(prices or [])
-            xs = list(range(len(self._prices)))
+            self._live_pending_prices = prices
+            if self._live_after is not None:
+                return
+            wait_ms = _LIVE_FRAME_MS - (time.monotonic() - self._live_last_render) * 1000.0
+            if wait_ms <= 0:
+                self._flush_live()
+                return
+            try:
+                self._live_after = self.after(int(math.ceil(wait_ms)), self._flush_live)
+            except Exception:
+                # widget not mapped / being destroyed: render inline
+                self._live_after = None
+                self._flush_live()
+
+        def _flush_live(self) -> None:
+            self._live_after = None
+            prices = self._live_pending_prices
+            self._live_pending_prices = None
+            if prices is not None:
+                self._live_last_render = time.monotonic()
+                self._render_live(prices)
+
+        def _render_live(self, prices: Sequence[float]) -> None:
+            self._set_blit_live(True)
+
+            # one float copy shared by the line and the indicators; x reused while n is stable
+            ind = self._ind_live
+            ind.update(prices or [])
+            self._prices = ind.values
+            xs = self._xs_for(len(self._prices))
             ys = self._prices
 
-            rsi_vals = _rsi(ys, period=14)
-            macd_line, signal_line, hist = _macd(ys)
+            rsi_vals = ind.rsi(14)
+            macd_line, signal_line, hist = ind.macd()
 
             # update artists
             try:
@@ -1462,8 +1791,7 @@ class ChartPanel(ttk.Frame):
                 pass
 
             self._line_price.set_data(xs, ys)
-            self.ax_price.relim()
-            self.ax_price.autoscale_view(scalex=True, scaley=True)
+            self._fit_live_price_axis(ys)
 
             if rsi_vals:
                 self._line_rsi.set_data(xs[: len(rsi_vals)], rsi_vals)
@@ -1477,23 +1805,7 @@ class ChartPanel(ttk.Frame):
 
                 # hist bars (FAST via PolyCollection)
                 try:
-                    width = 0.65
-                    verts = []
-                    colors = []
-                    for i, h in enumerate(hist):
-                        x = xs_macd[i]
-                        left = x - width / 2.0
-                        right = x + width / 2.0
-                        bottom = 0.0
-                        top = float(h)
-                        verts.append([
-                            (left, bottom),
-                            (right, bottom),
-                            (right, top),
-                            (left, top),
-                            (left, bottom),
-                        ])
-                        colors.append(self.theme.hist_pos if top >= 0 else self.theme.hist_neg)
+                    verts, colors = self._hist_polys(xs_macd, hist)
 
                     if self._macd_hist_collection is None and PolyCollection is not None:
                         self._macd_hist_collection = PolyCollection(
@@ -1505,6 +1817,7 @@ class ChartPanel(ttk.Frame):
                             zorder=1,
                         )
                         self.ax_macd.add_collection(self._macd_hist_collection)
+                        self._macd_hist_collection.set_animated(self._blit_live)
                     elif self._macd_hist_collection is not None:
                         self._macd_hist_collection.set_verts(verts)
                         self._macd_hist_collection.set_facecolors(colors)
@@ -1548,9 +1861,15 @@ class ChartPanel(ttk.Frame):
                         try:
                             if cur_lo is None or cur_hi is None:
                                 must = True
-                            elif want_lo < cur_lo or want_hi > cur_hi:
+                            elif lo < cur_lo or hi > cur_hi:
+                                # data left the axis (the padding is headroom, not a trigger)
                                 must = True
-                            elif now2 - float(getattr(self, "_last_macd_ylim_ts", 0.0) or 0.0) > 0.80:
+                            elif (
+                                now2 - float(getattr(self, "_last_macd_ylim_ts", 0.0) or 0.0) > 0.80
+                                and (want_hi - want_lo) < 0.5 * (cur_hi - cur_lo)
+                            ):
+                                # shrink only when the data uses under half the axis:
+                                # a new ylim is a full redraw instead of a blit
                                 must = True
                         except Exception:
                             must = True
@@ -1595,7 +1914,129 @@ class ChartPanel(ttk.Frame):
                 self._line_macd.set_data([], [])
                 self._line_signal.set_data([], [])
 
+            self._blit_or_draw()
+
+        def _fit_live_price_axis(self, ys: Sequence[float]) -> None:
+            """Price axis limits for tick series (autoscale is off on ax_price).
+
+            Limits change only when the data leaves them or uses under half of
+            the range: unchanged limits keep live frames on the blit path.
+            """
+            n = len(ys)
+            if n == 0:
+                return
+            xlim = (-1.0, float(n))
+            if self.ax_price.get_xlim() != xlim:
+                self.ax_price.set_xlim(*xlim)
+            lo = min(ys)
+            hi = max(ys)
+            cur_lo, cur_hi = self.ax_price.get_ylim()
+            if lo < cur_lo or hi > cur_hi or (hi - lo) < 0.5 * (cur_hi - cur_lo):
+                pad = (hi - lo) * 0.10 if hi > lo else max(1e-9, abs(hi) * 0.02)
+                self.ax_price.set_ylim(lo - pad, hi + pad)
+
+        def _hist_polys(self, xs: Sequence[float], hist: Sequence[float]) -> Tuple[Any, Any]:
+            """MACD histogram bars as closed rectangles + per-bar colors.
+
+            With numpy: one (n, 5, 2) vertex array and an (n, 4) RGBA array built
+            in C (PolyCollection takes both as-is), instead of n Python lists.
+            """
+            width = 0.65
+            if np is not None:
+                x = np.asarray(xs, dtype=np.float64)
+                top = np.asarray(hist, dtype=np.float64)
+                left = x - width / 2.0
+                right = x + width / 2.0
+                verts = np.zeros((len(top), 5, 2), dtype=np.float64)  # bottom = 0.0
+                verts[:, (0, 3, 4), 0] = left[:, None]
+                verts[:, (1, 2), 0] = right[:, None]
+                verts[:, 2, 1] = top
+                verts[:, 3, 1] = top
+                pos = top >= 0
+                colors = np.where(pos[:, None], self._hist_rgba[0], self._hist_rgba[1])
+                return verts, colors
+
+            verts = []
+            colors = []
+            for i, h in enumerate(hist):
+                x = xs[i]
+                left = x - width / 2.0
+                right = x + width / 2.0
+                bottom = 0.0
+                top = float(h)
+                verts.append([
+                    (left, bottom),
+                    (right, bottom),
+                    (right, top),
+                    (left, top),
+                    (left, bottom),
+                ])
+                colors.append(self.theme.hist_pos if top >= 0 else self.theme.hist_neg)
+            return verts, colors
+
+        # ----------------------------- live blitting
+
+        def _live_artists(self) -> list:
+            arts = [self._line_price, self._line_rsi, self._line_macd, self._line_signal]
+            if self._macd_hist_collection is not None:
+                arts.append(self._macd_hist_collection)
+            return arts
+
+        def _set_blit_live(self, on: bool) -> None:
+            """Live mode: series artists are animated (excluded from full draws, blitted)."""
+            if on == self._blit_live:
+                return
+            self._blit_live = on
+            self._blit_bg = None
+            for a in self._live_artists():
+                try:
+                    a.set_animated(on)
+                except Exception:
+                    pass
+
+        def _draw_live_artists(self) -> None:
+            for a in self._live_artists():
+                ax = a.axes
+                if ax is not None and ax.get_visible() and a.get_visible():
+                    ax.draw_artist(a)
+
+        def _on_draw_event(self, _event: Any) -> None:
+            if not self._blit_live:
+                return
             try:
-                self.canvas.draw_idle()
+                self._blit_bg = self.canvas.copy_from_bbox(self.figure.bbox)
+                # animated artists are skipped by the full draw: paint them into this frame
+                self._draw_live_artists()
             except Exception:
-                pass
+                self._blit_bg = None
+
+        def _axes_limits(self) -> tuple:
+            return tuple(
+                (ax.get_xlim(), ax.get_ylim()) for ax in (self.ax_price, self.ax_rsi, self.ax_macd)
+            )
+
+        def _blit_or_draw(self) -> None:
+            """Blit the live series onto the cached background; full draw if limits changed."""
+            limits = self._axes_limits()
+            if (
+                self._blit_bg is None
+                or limits != self._blit_limits
+                or self._macd_hist is not None  # legacy bars are not animated
+            ):
+                self._blit_limits = limits
+                self._blit_bg = None  # recaptured by the draw_event of this full draw
+                try:
+                    self.canvas.draw_idle()
+                except Exception:
+                    pass
+                return
+            try:
+                self.canvas.restore_region(self._blit_bg)
+                self._draw_live_artists()
+                self.canvas.blit(self.figure.bbox)
+            except Exception:
+                self._blit_bg = None
+                try:
+                    self.canvas.draw_idle()
+                except Exception:
+                    pass